@@ -0,0 +1,129 @@
+import hashlib
+import json
+import logging
+import os
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Optional
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+logger = logging.getLogger(__name__)
+
+# Parquet schema metadata key holding the UTC time an entry was written
+FETCHED_AT_KEY: bytes = b"fetched_at"
+
+# Parquet schema metadata key holding a per-entry TTL override, in seconds
+TTL_SECONDS_KEY: bytes = b"ttl_seconds"
+
+
+class FileCache:
+    """
+    On-disk cache of fetched DataFrames stored as zstd-compressed Parquet files.
+
+    Entries live under `{cache_dir}/{namespace}/{key}.parquet` and carry the time they were
+    written in the file's schema metadata; entries older than the TTL (the cache default, or
+    the override given to put) are treated as misses.
+
+    Attributes:
+        cache_dir (str): Root directory of the cache.
+        ttl (timedelta): How long an entry stays valid after it is written.
+    """
+
+    def __init__(self, cache_dir: str, ttl_days: float = 90) -> None:
+        """
+        Initializes the FileCache.
+
+        Args:
+            cache_dir (str): Root directory of the cache. Created on first write.
+            ttl_days (float): Number of days an entry stays valid.
+        """
+        self.cache_dir: str = cache_dir
+        self.ttl: timedelta = timedelta(days=float(ttl_days))
+
+    @staticmethod
+    def make_key(params: Dict[str, Any]) -> str:
+        """
+        Builds a stable cache key from request parameters.
+
+        Args:
+            params (Dict[str, Any]): The parameters identifying a request. Values that are not
+                JSON serializable are converted with str().
+
+        Returns:
+            str: The MD5 hex digest of the parameters, independent of their order.
+        """
+        payload: str = json.dumps(params, sort_keys=True, default=str)
+        return hashlib.md5(payload.encode()).hexdigest()
+
+    def _path(self, key: str, namespace: str) -> str:
+        """
+        Returns the file path of a cache entry.
+        """
+        return os.path.join(self.cache_dir, namespace, f"{key}.parquet")
+
+    def get(self, key: str, namespace: str = "") -> Optional[pd.DataFrame]:
+        """
+        Reads a cache entry.
+
+        Args:
+            key (str): The entry key (see make_key).
+            namespace (str): Subdirectory grouping related entries, e.g. a symbol.
+
+        Returns:
+            Optional[pd.DataFrame]: The cached DataFrame, or None when the entry is missing,
+            expired, or unreadable.
+        """
+        path: str = self._path(key, namespace)
+        if not os.path.exists(path):
+            return None
+
+        try:
+            table: pa.Table = pq.read_table(path)
+        except (OSError, pa.ArrowException) as e:
+            logger.warning("Ignoring unreadable cache entry %s: %s", path, e)
+            return None
+
+        metadata: Dict[bytes, bytes] = table.schema.metadata or {}
+        fetched_at_raw: Optional[bytes] = metadata.get(FETCHED_AT_KEY)
+        if fetched_at_raw is None:
+            return None
+        fetched_at: datetime = datetime.fromisoformat(fetched_at_raw.decode())
+        ttl_seconds_raw: Optional[bytes] = metadata.get(TTL_SECONDS_KEY)
+        ttl: timedelta = timedelta(seconds=float(ttl_seconds_raw)) if ttl_seconds_raw is not None else self.ttl
+        if datetime.now(timezone.utc) - fetched_at > ttl:
+            logger.info("Cache entry %s expired (fetched at %s).", path, fetched_at)
+            return None
+
+        return table.to_pandas()
+
+    def put(self, key: str, data: pd.DataFrame, namespace: str = "", ttl: Optional[timedelta] = None) -> None:
+        """
+        Writes a cache entry, replacing any existing entry with the same key. Write failures
+        are logged and otherwise ignored.
+
+        Args:
+            key (str): The entry key (see make_key).
+            data (pd.DataFrame): The DataFrame to cache. Empty frames are valid entries and
+                record that a request returned no data.
+            namespace (str): Subdirectory grouping related entries, e.g. a symbol.
+            ttl (Optional[timedelta]): How long this entry stays valid. Defaults to the cache TTL.
+        """
+        path: str = self._path(key, namespace)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+
+            table: pa.Table = pa.Table.from_pandas(data)
+            metadata: Dict[bytes, bytes] = dict(table.schema.metadata or {})
+            metadata[FETCHED_AT_KEY] = datetime.now(timezone.utc).isoformat().encode()
+            if ttl is not None:
+                metadata[TTL_SECONDS_KEY] = str(ttl.total_seconds()).encode()
+            table = table.replace_schema_metadata(metadata)
+
+            # Write to a temporary file first so readers never see a partial entry
+            tmp_path: str = f"{path}.tmp"
+            pq.write_table(table, tmp_path, compression="zstd")
+            os.replace(tmp_path, path)
+        except (OSError, pa.ArrowException) as e:
+            # A failed write only costs a future cache miss
+            logger.warning("Could not write cache entry %s: %s", path, e)
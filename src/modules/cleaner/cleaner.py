@@ -1,9 +1,36 @@
 from abc import ABC, abstractmethod
+import numpy as np
 import pandas as pd
-from typing import List, Dict, Any
+from typing import Callable, List, Dict, Any
 import logging
 
 
+def _is_enabled(value: Any) -> bool:
+    """
+    Interprets a config flag that may be a YAML boolean or a string such as "True" / " true ".
+    """
+    return str(value).strip().lower() == "true"
+
+
+def _skip_categorical(
+    operation: Callable[[pd.DataFrame], pd.DataFrame],
+) -> Callable[[pd.DataFrame], pd.DataFrame]:
+    """
+    Wraps a missing-data operation so it leaves categorical (dictionary-encoded) columns such as
+    symbol untouched, since they cannot be interpolated or filled with values outside their categories.
+    """
+    def apply(data: pd.DataFrame) -> pd.DataFrame:
+        categorical: pd.Index = data.select_dtypes(include="category").columns
+        if categorical.empty:
+            return operation(data)
+        result: pd.DataFrame = data.copy()
+        filled: pd.DataFrame = operation(data.drop(columns=categorical))
+        result[filled.columns] = filled
+        return result
+
+    return apply
+
+
 class Cleaner(ABC):
     """
     Abstract base class for Cleaner modules responsible for standardizing raw data
@@ -78,10 +105,11 @@ class Cleaner(ABC):
         Returns:
             List[pd.Timestamp]: List of missing timestamps.
         """
-        data[time_column] = pd.to_datetime(data[time_column])
-        data = data.sort_values(by=time_column)
-        time_range = pd.date_range(start=data[time_column].min(), end=data[time_column].max(), freq=freq)
-        missing_timestamps = time_range.difference(data[time_column])
+        times = pd.DatetimeIndex(pd.to_datetime(data[time_column], cache=True))
+        time_range = pd.date_range(start=times.min(), end=times.max(), freq=freq)
+
+        # Membership test on int64 nanosecond views; min/max above need no sort
+        missing_timestamps = time_range[~np.isin(time_range.asi8, times.asi8)]
 
         return missing_timestamps
 
@@ -94,7 +122,7 @@ class Cleaner(ABC):
         """
         logging.basicConfig(filename='data_quality.log', level=logging.INFO)
         for timestamp in missing_timestamps:
-            logging.warning(f"Missing data at timestamp: {timestamp}")
+            logging.warning("Missing data at timestamp: %s", timestamp)
 
     def clean(self, data: pd.DataFrame) -> pd.DataFrame:
         """
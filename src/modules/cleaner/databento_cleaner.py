@@ -1,7 +1,9 @@
+import numpy as np
 import pandas as pd
+import pyarrow as pa
 from enum import Enum
-from typing import Dict, Any, List
-from src.modules.cleaner.cleaner import Cleaner
+from typing import Callable, Dict, Any, List, Tuple
+from src.modules.cleaner.cleaner import Cleaner, _is_enabled, _skip_categorical
 import logging
 
 
@@ -27,12 +29,64 @@ class RequiredFields(Enum):
     VOLUME = "volume"
 
 
+# Column names of the cleaned output, in RequiredFields order
+REQUIRED_COLUMNS: List[str] = [field.value for field in RequiredFields]
+
+# Order in which enabled missing-data methods are applied
+MISSING_DATA_METHODS: Tuple[str, ...] = (
+    "drop_nan",
+    "forward_fill",
+    "backward_fill",
+    "interpolate",
+    "zero_fill",
+    "mean_fill",
+    "median_fill",
+    "custom_fill",
+)
+
+
+def _compute_cumulative_adjustments(
+    symbol_codes: np.ndarray,
+    volume: np.ndarray,
+    open_: np.ndarray,
+    close: np.ndarray,
+) -> np.ndarray:
+    """
+    Computes the back-adjustment owed by each row with a vectorized suffix sum.
+
+    A roll happens at row i when the symbol changes and the new contract's volume exceeds the
+    previous one; its adjustment (close[i - 1] - open[i]) applies to every row before i.
+
+    Args:
+        symbol_codes (np.ndarray): Integer codes of the symbol column (e.g., from pd.factorize).
+        volume (np.ndarray): Volume per row.
+        open_ (np.ndarray): Opening price per row.
+        close (np.ndarray): Closing price per row.
+
+    Returns:
+        np.ndarray: float64 array where element i is the sum of adjustments for rolls after row i.
+    """
+    n = symbol_codes.shape[0]
+    adjustments = np.zeros(n, dtype=np.float64)
+    if n > 1:
+        rolls = (symbol_codes[1:] != symbol_codes[:-1]) & (volume[1:] > volume[:-1])
+        adjustments[1:] = np.where(rolls, close[:-1] - open_[1:], 0.0)
+
+    # Suffix sum shifted by one, so row i only sees rolls at indices strictly greater than i
+    suffix = np.cumsum(adjustments[::-1])[::-1]
+    out = np.zeros(n, dtype=np.float64)
+    out[:-1] = suffix[1:]
+    return out
+
+
 class DatabentoCleaner(Cleaner):
     """
     A Cleaner subclass for standardizing Databento data.
 
     Methods:
         clean: Main entry point to validate, transform, and standardize raw data. 
+        clean_as_frame: Same as clean, but returns the cleaned DataFrame.
+        clean_as_table: Same as clean, but returns a pyarrow Table for bulk COPY.
         validate_fields: Ensure required fields are present in Databento data.
         handle_missing_data: Handle missing or corrupt data.
         transform_data: Standardize timestamps and field types.
@@ -47,6 +101,30 @@ class DatabentoCleaner(Cleaner):
         """
         self.config: Dict[str, Any] = config
         self.logger: logging.Logger = logging.getLogger("DatabentoCleaner")
+        # Opt-in: store prices as float32 and volume in the narrowest int dtype that fits
+        self.compact_dtypes: bool = _is_enabled((self.config.get("cleaner") or {}).get("compact_dtypes", False))
+
+        # Resolve the enabled missing-data methods once instead of on every clean
+        missing_data_config: Dict[str, Any] = self.config.get("missing_data") or {}
+        enabled: set = {method for method, value in missing_data_config.items() if _is_enabled(value)}
+        self._enabled_methods: Tuple[str, ...] = tuple(method for method in MISSING_DATA_METHODS if method in enabled)
+
+        # Bind each enabled method to its operation against this config, so cleaning only
+        # walks the enabled steps
+        custom_value: Any = missing_data_config.get("custom_value", 0)
+        method_switch: Dict[str, Callable[[pd.DataFrame], pd.DataFrame]] = {
+            "drop_nan": lambda d: d.dropna(),
+            "forward_fill": lambda d: d.ffill(),
+            "backward_fill": lambda d: d.bfill(),
+            "interpolate": _skip_categorical(lambda d: d.infer_objects().interpolate()),
+            "zero_fill": _skip_categorical(lambda d: d.fillna(0)),
+            "mean_fill": lambda d: d.fillna(d.select_dtypes(include="number").mean()),
+            "median_fill": lambda d: d.fillna(d.select_dtypes(include="number").median()),
+            "custom_fill": _skip_categorical(lambda d: d.fillna(custom_value)),
+        }
+        self._missing_ops: Tuple[Tuple[str, Callable[[pd.DataFrame], pd.DataFrame]], ...] = tuple(
+            (method, method_switch[method]) for method in self._enabled_methods
+        )
 
     def clean(self, data: pd.DataFrame) -> List[Dict[str, any]]:
         """
@@ -58,6 +136,29 @@ class DatabentoCleaner(Cleaner):
         Returns:
             List[Dict[str, Any]]: Cleaned data ready for insertion.
 
+        Raises:
+            ValueError: If data is empty or required fields are missing.
+        """
+        data = self.clean_as_frame(data)
+
+        # Convert to a list of dictionaries for database insertion
+        columns: List[str] = list(data.columns)
+        cleaned_data: List[Dict[str, Any]] = [
+            dict(zip(columns, row)) for row in data.itertuples(index=False, name=None)
+        ]
+        return cleaned_data
+
+    def clean_as_frame(self, data: pd.DataFrame) -> pd.DataFrame:
+        """
+        Cleans and standardizes raw Databento data, returning the DataFrame itself
+        for consumers that do not need one dictionary per row.
+
+        Args:
+            data (pd.DataFrame): Raw data from Databento API.
+
+        Returns:
+            pd.DataFrame: Cleaned data ready for insertion.
+
         Raises:
             ValueError: If data is empty or required fields are missing.
         """
@@ -72,11 +173,23 @@ class DatabentoCleaner(Cleaner):
         data = self.handle_missing_data(data)
 
         # Transform the data into the desired format
-        data = self.transform_data(data)
+        return self.transform_data(data)
 
-        # Convert to a list of dictionaries for database insertion
-        cleaned_data: List[Dict[str, Any]] = data.to_dict(orient="records")
-        return cleaned_data
+    def clean_as_table(self, data: pd.DataFrame) -> pa.Table:
+        """
+        Cleans and standardizes raw Databento data into a columnar Arrow table,
+        avoiding one Python dictionary per row for bulk inserters.
+
+        Args:
+            data (pd.DataFrame): Raw data from Databento API.
+
+        Returns:
+            pa.Table: Cleaned data ready for insertion.
+
+        Raises:
+            ValueError: If data is empty or required fields are missing.
+        """
+        return pa.Table.from_pandas(self.clean_as_frame(data), preserve_index=False)
 
     def validate_fields(self, data: pd.DataFrame) -> pd.DataFrame:
         """
@@ -96,15 +209,21 @@ class DatabentoCleaner(Cleaner):
         if "ts_event" in data.index.names:
             data = data.reset_index()
 
-        # Rename columns if needed
-        if "ts_event" in data.columns:
-            data: pd.DataFrame = data.rename(columns={"ts_event": "time"})
+        # Read the time from ts_event when present; it is renamed after the columns are narrowed
+        source_columns: List[str] = [
+            "ts_event" if field == "time" and "ts_event" in data.columns else field
+            for field in REQUIRED_COLUMNS
+        ]
 
-        required_fields: List[str] = [field.value for field in RequiredFields]
-        missing_fields: List[str] = [field for field in required_fields if field not in data.columns]
+        missing_fields: List[str] = pd.Index(source_columns).difference(data.columns, sort=False).tolist()
         if missing_fields:
             logging.error(f"Missing required fields: {missing_fields}")
             raise ValueError(f"Missing required fields: {missing_fields}")
+
+        # Narrow to the schema columns up front so later stages touch only what is inserted.
+        # reindex makes the only copy; renaming the narrowed frame in place avoids a second one.
+        data = data.reindex(columns=source_columns)
+        data.columns = REQUIRED_COLUMNS
         return data
 
     def handle_missing_data(self, data: pd.DataFrame) -> pd.DataFrame:
@@ -127,24 +246,16 @@ class DatabentoCleaner(Cleaner):
         Returns:
             pd.DataFrame: The data after handling missing values.
         """
-        # Get numeric columns
-        numeric_columns = data.select_dtypes(include=['int64', 'float64']).columns
+        # Nothing to do when no method is enabled or the frame has no missing values
+        if not self._missing_ops or not data.isna().to_numpy().any():
+            return data
 
-        method_switch = {
-            "drop_nan": lambda d: d.dropna(),
-            "forward_fill": lambda d: d.ffill(),
-            "backward_fill": lambda d: d.bfill(),
-            "interpolate": lambda d: d.infer_objects().interpolate(),
-            "zero_fill": lambda d: d.fillna(0),
-            "mean_fill": lambda d: d.fillna({col: d[col].mean() for col in numeric_columns}),
-            "median_fill": lambda d: d.fillna({col: d[col].median() for col in numeric_columns}),
-            "custom_fill": lambda d: d.fillna(self.config["missing_data"].get("custom_value", 0)),
-        }
-
-        for method, action in method_switch.items():
-            if self.config.get("missing_data", {}).get(method, "False") == "True":
-                logging.info(f"Applying {method.replace('_', ' ')}.")
-                data = action(data)
+        for method, operation in self._missing_ops:
+            logging.info("Applying %s.", method.replace('_', ' '))
+            data = operation(data)
+            # Remaining methods are no-ops once every gap is filled or dropped
+            if not data.isna().to_numpy().any():
+                break
 
         return data
 
@@ -160,43 +271,86 @@ class DatabentoCleaner(Cleaner):
         """
         logging.info("Starting data transformation.")
 
+        # Drop columns not needed for the database in a single selection
+        # (already done by validate_fields when called through clean)
+        if list(data.columns) != REQUIRED_COLUMNS:
+            logging.info("Dropping unnecessary columns.")
+            data = data[REQUIRED_COLUMNS]
+
+        # Ensure correct data types with one bulk cast; this also yields the frame
+        # the remaining steps write into
+        logging.info("Converting data types for price and volume columns.")
+        # Explicit 64-bit dtypes; copy=False leaves columns that already match untouched
+        data = data.astype(
+            {"open": np.float64, "high": np.float64, "low": np.float64, "close": np.float64, "volume": np.int64},
+            copy=False,
+        )
+
         # Convert timestamps to UTC
         logging.info("Converting timestamps to UTC.")
-        if isinstance(data["time"].dtype, pd.DatetimeTZDtype):
-            # If already tz-aware, use tz_convert
+        # utc=True converts tz-aware input and localizes naive input in the same call
+        if data["time"].dtype.kind in "iu":
+            # Databento epoch nanoseconds: pure arithmetic, no string parsing
+            data["time"] = pd.to_datetime(data["time"], unit="ns", utc=True)
+        elif isinstance(data["time"].dtype, pd.DatetimeTZDtype):
+            # Databento's ts_event arrives tz-aware: a metadata-only conversion
             data["time"] = data["time"].dt.tz_convert("UTC")
+        elif data["time"].dtype.kind == "M":
+            data["time"] = data["time"].dt.tz_localize("UTC")
         else:
-            # If not tz-aware, localize to UTC
-            data["time"] = pd.to_datetime(data["time"]).dt.tz_localize("UTC")
-
-        # Ensure correct data types
-        logging.info("Converting data types for price and volume columns.")
-        data["open"] = data["open"].astype(float)
-        data["high"] = data["high"].astype(float)
-        data["low"] = data["low"].astype(float)
-        data["close"] = data["close"].astype(float)
-        data["volume"] = data["volume"].astype(int)
-
-        # Drop columns not needed for the database
-        logging.info("Dropping unnecessary columns.")
-        for column in data.columns:
-            if column not in [field.value for field in RequiredFields]:
-                data = data.drop(columns=column)
+            # An explicit format keeps strings on the fast ISO parser instead of per-element
+            # dateutil inference; cache=True parses each distinct string only once
+            data["time"] = pd.to_datetime(data["time"], format="ISO8601", utc=True, cache=True)
 
         # Check for duplicates in the time column
         if data["time"].duplicated().any():
             logging.warning("Duplicate timestamps found in 'time' column. Consider deduplication.")
 
-        # Sort the data by the time column
-        logging.info("Sorting data by 'time' column.")
-        data = data.sort_values(by="time")
+        # Sort the data by the time column; Databento already returns rows in ts_event
+        # order, so the O(n) monotonic check usually lets us skip the sort and its copy
+        if not data["time"].is_monotonic_increasing:
+            logging.info("Sorting data by 'time' column.")
+            data = data.sort_values(by="time", kind="mergesort")
         
         # Apply back-adjustment for futures using volume based roll
         logging.info("Applying back-adjustment to OHLC values.")
         data = self.apply_back_adjustment(data)
-        
+
+        # Downcast only the final frame, so roll adjustments are computed at full precision
+        if self.compact_dtypes:
+            data = self.compact_numeric_dtypes(data)
+
         return data
 
+    def compact_numeric_dtypes(self, data: pd.DataFrame) -> pd.DataFrame:
+        """
+        Downcasts OHLC prices to float32 and volume to the smallest signed integer dtype
+        that holds its observed range, halving (or better) the bytes moved by serialization
+        and insertion.
+
+        Args:
+            data (pd.DataFrame): Data with numeric open, high, low, close, and volume columns.
+
+        Returns:
+            pd.DataFrame: The data with compacted numeric columns.
+        """
+        volume = data["volume"].astype("int64")
+        c_min, c_max = (volume.min(), volume.max()) if len(volume) else (0, 0)
+        volume_dtype = np.int64
+        for candidate in (np.int8, np.int16, np.int32):
+            info = np.iinfo(candidate)
+            if info.min <= c_min and c_max <= info.max:
+                volume_dtype = candidate
+                break
+
+        return data.astype({
+            "open": np.float32,
+            "high": np.float32,
+            "low": np.float32,
+            "close": np.float32,
+            "volume": volume_dtype,
+        })
+
     def apply_back_adjustment(self, data: pd.DataFrame) -> pd.DataFrame:
         """
         Applies back-adjustment to futures data using a volume-based roll.
@@ -214,26 +368,17 @@ class DatabentoCleaner(Cleaner):
         # Reset index to have indexing 
         data = data.reset_index(drop=True)
 
-        # Find roll points 
-        # Detected when the symbol changes and the new contract's volume is greater
-        roll_factors = []
-        for i in range(1, len(data)):
-            if data.loc[i, 'symbol'] != data.loc[i - 1, 'symbol']:
-                if data.loc[i, 'volume'] > data.loc[i - 1, 'volume']:
-                    # Adjustment factor: previous contract's close minus new contract's open
-                    adjustment = data.loc[i - 1, 'close'] - data.loc[i, 'open']
-                    roll_factors.append((i, adjustment))
-
-        # Cumulative adjustment for each row:
-        cumulative_adjustments = []
-        for i in range(len(data)):
-            cum_adj = sum(adj for (roll_idx, adj) in roll_factors if roll_idx > i)
-            cumulative_adjustments.append(cum_adj)
-
-        # Apply back-adjustment directly to the original OHLC columns
-        data['open'] = data['open'] + cumulative_adjustments
-        data['high'] = data['high'] + cumulative_adjustments
-        data['low'] = data['low'] + cumulative_adjustments
-        data['close'] = data['close'] + cumulative_adjustments
+        # Roll detection and the cumulative sum run on plain ndarrays
+        symbol_codes, _ = pd.factorize(data['symbol'])
+        cumulative_adjustments = _compute_cumulative_adjustments(
+            symbol_codes,
+            data['volume'].to_numpy(),
+            data['open'].to_numpy(dtype=np.float64),
+            data['close'].to_numpy(dtype=np.float64),
+        ).astype(data['close'].dtype, copy=False)
+
+        # Apply back-adjustment directly to the original OHLC columns, keeping their dtype
+        price_columns = ['open', 'high', 'low', 'close']
+        data[price_columns] = data[price_columns].add(cumulative_adjustments, axis=0)
 
         return data
@@ -2,7 +2,7 @@ import logging
 import pandas as pd
 from enum import Enum
 from typing import Dict, Any, List
-from src.modules.cleaner.cleaner import Cleaner
+from src.modules.cleaner.cleaner import Cleaner, _is_enabled, _skip_categorical
 
 
 class RequiredFields(Enum):
@@ -28,6 +28,9 @@ class RequiredFields(Enum):
     SPLIT_FACTOR = "split_factor"
 
 
+# Column names of the cleaned output, in RequiredFields order
+REQUIRED_COLUMNS: List[str] = [field.value for field in RequiredFields]
+
 # Price columns that must be strictly positive to be considered valid.
 PRICE_COLUMNS = ["open", "high", "low", "close", "adj_open", "adj_high", "adj_low", "adjusted_close"]
 
@@ -82,14 +85,14 @@ class TiingoCleaner(Cleaner):
         Raises:
             ValueError: If any required column is absent.
         """
-        required: List[str] = [f.value for f in RequiredFields]
-        missing: List[str] = [c for c in required if c not in data.columns]
+        missing: List[str] = pd.Index(REQUIRED_COLUMNS).difference(data.columns, sort=False).tolist()
         if missing:
             self.logger.error(f"[TiingoCleaner] Missing required fields: {missing}")
             raise ValueError(f"Missing required fields: {missing}")
 
-        data = data[required].copy()
-        self.logger.info(f"[TiingoCleaner] validate_fields passed. Shape: {data.shape}")
+        # reindex returns a fresh frame, so no second .copy() is needed before later assignments
+        data = data.reindex(columns=REQUIRED_COLUMNS)
+        self.logger.info("[TiingoCleaner] validate_fields passed. Shape: %s", data.shape)
         return data
 
     def handle_missing_data(self, data: pd.DataFrame) -> pd.DataFrame:
@@ -100,21 +103,23 @@ class TiingoCleaner(Cleaner):
         Always drops rows with null time/symbol and rows with non-positive prices
         or negative volume, regardless of config.
         """
-        numeric_columns = data.select_dtypes(include=["int64", "float64"]).columns
+        numeric_columns = data.select_dtypes(include="number").columns
+        missing_data_config: Dict[str, Any] = self.config.get("missing_data") or {}
 
+        # mean/median reduce every numeric column in one call and fill from the resulting Series
         method_switch = {
             "drop_nan": lambda d: d.dropna(),
             "forward_fill": lambda d: d.ffill(),
             "backward_fill": lambda d: d.bfill(),
-            "interpolate": lambda d: d.infer_objects().interpolate(),
-            "zero_fill": lambda d: d.fillna(0),
-            "mean_fill": lambda d: d.fillna({col: d[col].mean() for col in numeric_columns}),
-            "median_fill": lambda d: d.fillna({col: d[col].median() for col in numeric_columns}),
-            "custom_fill": lambda d: d.fillna(self.config.get("missing_data", {}).get("custom_value", 0)),
+            "interpolate": _skip_categorical(lambda d: d.infer_objects().interpolate()),
+            "zero_fill": _skip_categorical(lambda d: d.fillna(0)),
+            "mean_fill": lambda d: d.fillna(d[numeric_columns].mean()),
+            "median_fill": lambda d: d.fillna(d[numeric_columns].median()),
+            "custom_fill": _skip_categorical(lambda d: d.fillna(missing_data_config.get("custom_value", 0))),
         }
         for method, action in method_switch.items():
-            if self.config.get("missing_data", {}).get(method, "False") == "True":
-                self.logger.info(f"[TiingoCleaner] Applying {method.replace('_', ' ')}.")
+            if _is_enabled(missing_data_config.get(method, False)):
+                self.logger.info("[TiingoCleaner] Applying %s.", method.replace('_', ' '))
                 data = action(data)
 
         initial_len = len(data)
@@ -144,11 +149,12 @@ class TiingoCleaner(Cleaner):
           - symbol stripped/uppercased
           - de-duplicated on (symbol, time), sorted ascending
         """
-        # Tiingo timestamps look like "2024-01-02T00:00:00.000Z" -> parse as UTC.
-        data["time"] = pd.to_datetime(data["time"], utc=True, errors="coerce")
+        # Tiingo timestamps look like "2024-01-02T00:00:00.000Z" -> parse as UTC. Declaring
+        # ISO 8601 skips per-row format inference; cache=True parses repeated strings once.
+        data["time"] = pd.to_datetime(data["time"], format="ISO8601", utc=True, errors="coerce", cache=True)
         bad_ts = int(data["time"].isna().sum())
         if bad_ts:
-            self.logger.warning(f"[TiingoCleaner] Dropping {bad_ts} rows with unparseable timestamps.")
+            self.logger.warning("[TiingoCleaner] Dropping %s rows with unparseable timestamps.", bad_ts)
             data = data.dropna(subset=["time"])
 
         for col in FLOAT_COLUMNS:
@@ -157,7 +163,7 @@ class TiingoCleaner(Cleaner):
         data["volume"] = pd.to_numeric(data["volume"], errors="coerce")
         bad_vol = int(data["volume"].isna().sum())
         if bad_vol:
-            self.logger.warning(f"[TiingoCleaner] Dropping {bad_vol} rows with non-numeric volume.")
+            self.logger.warning("[TiingoCleaner] Dropping %s rows with non-numeric volume.", bad_vol)
             data = data.dropna(subset=["volume"])
         data["volume"] = data["volume"].astype("int64")
 
@@ -166,10 +172,10 @@ class TiingoCleaner(Cleaner):
         pre_dedup = len(data)
         data = data.drop_duplicates(subset=["symbol", "time"])
         if pre_dedup - len(data):
-            self.logger.info(f"[TiingoCleaner] Removed {pre_dedup - len(data)} duplicate (symbol, time) rows.")
+            self.logger.info("[TiingoCleaner] Removed %s duplicate (symbol, time) rows.", pre_dedup - len(data))
 
         data = data.sort_values(by=["symbol", "time"]).reset_index(drop=True)
-        self.logger.info(f"[TiingoCleaner] transform_data complete. Final shape: {data.shape}")
+        self.logger.info("[TiingoCleaner] transform_data complete. Final shape: %s", data.shape)
         return data
 
     def detect_time_gaps(self, data: pd.DataFrame, time_column: str = "time", freq: str = "B") -> List[pd.Timestamp]:
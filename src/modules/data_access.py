@@ -1,9 +1,10 @@
-from typing import List, Dict, Optional, Any, Type, Tuple
+from typing import Iterator, List, Dict, Optional, Any, Type, Tuple
 from sqlalchemy.orm import Session, sessionmaker
 from sqlalchemy.engine import Engine
-from sqlalchemy import create_engine, text
+from sqlalchemy import create_engine, select, text
 from sqlalchemy.exc import SQLAlchemyError
-from src.modules.db_models import get_engine, OHLCV
+from sqlalchemy.sql import Select
+from src.modules.db_models import bulk_insert_ohlcv, get_engine, OHLCV
 import pandas as pd
 import logging
 
@@ -11,8 +12,13 @@ import logging
 class DataAccess:
     """
     A data access layer for querying the OHLCV table in PostgreSQL using SQLAlchemy ORM.
+
+    Attributes:
+        STREAM_BATCH_SIZE (int): Default number of records per batch yielded by iter_ohlcv_data.
     """
 
+    STREAM_BATCH_SIZE: int = 50_000
+
     def __init__(self, config: Optional[Dict[str, Any]] = None) -> None:
         """
         Initializes the DataAccess class by creating a database engine and session maker.
@@ -23,6 +29,33 @@ class DataAccess:
         self.logger: logging.Logger = logging.getLogger("DataAccess")
         self.logger.setLevel(logging.INFO)
 
+    def _ohlcv_statement(
+        self,
+        start_date: str,
+        end_date: str,
+        symbols: Optional[List[str]] = None
+    ) -> Select:
+        """
+        Builds the OHLCV query for a date range and optional symbols, ordered by symbol and time.
+        Table columns are selected directly so rows come back as mappings, not ORM objects.
+
+        Args:
+            start_date (str): The start date in 'YYYY-MM-DD' format.
+            end_date (str): The end date in 'YYYY-MM-DD' format.
+            symbols (Optional[List[str]]): A list of symbols to filter.
+
+        Returns:
+            Select: The query.
+        """
+        statement = select(*OHLCV.__table__.columns).where(
+            OHLCV.time.between(start_date, end_date)
+        )
+        if symbols:
+            statement = statement.where(OHLCV.symbol.in_(symbols))
+
+        # Order by symbol and time
+        return statement.order_by(OHLCV.symbol, OHLCV.time)
+
     def get_ohlcv_data(
         self, 
         start_date: str, 
@@ -30,7 +63,8 @@ class DataAccess:
         symbols: Optional[List[str]] = None
     ) -> List[Dict[str, Any]]:
         """
-        Retrieves OHLCV data for the specified date range and symbols.
+        Retrieves OHLCV data for the specified date range and symbols. The whole result is held
+        in memory; use iter_ohlcv_data for multi-year pulls.
 
         Args:
             start_date (str): The start date in 'YYYY-MM-DD' format.
@@ -40,24 +74,44 @@ class DataAccess:
         Returns:
             List[Dict[str, Any]]: A list of OHLCV records.
         """
+        statement = self._ohlcv_statement(start_date, end_date, symbols)
+
         with self.Session() as session:
-            query = session.query(OHLCV).filter(
-                OHLCV.time.between(start_date, end_date)
-            )
-            if symbols:
-                query = query.filter(OHLCV.symbol.in_(symbols))
+            result: List[Dict[str, Any]] = [
+                dict(row) for row in session.execute(statement).mappings().all()
+            ]
+
+        return result
 
-            # Order by symbol and time
-            query = query.order_by(OHLCV.symbol, OHLCV.time)
+    def iter_ohlcv_data(
+        self,
+        start_date: str,
+        end_date: str,
+        symbols: Optional[List[str]] = None,
+        batch_size: int = STREAM_BATCH_SIZE
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Streams OHLCV data for the specified date range and symbols in batches, in the same order
+        as get_ohlcv_data. Rows are read through a server-side cursor, so at most one batch is
+        held in memory at a time. The session stays open until the generator is exhausted or
+        closed.
 
-            data: List[OHLCV] = query.all()
-            result: List[Dict[str, Any]] = [record.__dict__ for record in data if record]
-            
-            # Remove SQLAlchemy's internal state metadata
-            for record in result:
-                record.pop("_sa_instance_state", None)
-            
-            return result
+        Args:
+            start_date (str): The start date in 'YYYY-MM-DD' format.
+            end_date (str): The end date in 'YYYY-MM-DD' format.
+            symbols (Optional[List[str]]): A list of symbols to filter.
+            batch_size (int): Maximum number of records per batch.
+
+        Yields:
+            List[Dict[str, Any]]: The next batch of OHLCV records.
+        """
+        statement = self._ohlcv_statement(start_date, end_date, symbols).execution_options(
+            stream_results=True
+        )
+
+        with self.Session() as session:
+            for partition in session.execute(statement).mappings().partitions(batch_size):
+                yield [dict(row) for row in partition]
 
     def get_symbols(self) -> List[str]:
         """
@@ -67,8 +121,9 @@ class DataAccess:
             List[str]: A list of unique symbols.
         """
         with self.Session() as session:  
-            symbols: List[Tuple[str]] = session.query(OHLCV.symbol).distinct().all()
-            return [symbol[0] for symbol in symbols]
+            # scalars() returns the column values directly instead of one-element row tuples
+            symbols: List[str] = session.scalars(select(OHLCV.symbol).distinct()).all()
+            return list(symbols)
         
     def get_earliest_date(self) -> Optional[str]:
         """
@@ -122,13 +177,18 @@ class DataAccess:
         Args:
             schema (str): Target schema (from config['database']['target_schema']).
             table (str): Target table (from config['database']['table']).
-            time_column (str): Timestamp column to max over. Defaults to 'time'.
+            time_column (str): Timestamp column to read the latest value of. Defaults to 'time'.
 
         Returns:
             Optional[str]: Latest date as 'YYYY-MM-DD', or None if the table is empty.
         """
         # schema/table/time_column come from trusted config, not user input.
-        query = text(f'SELECT MAX("{time_column}") FROM "{schema}"."{table}"')
+        # ORDER BY ... LIMIT 1 walks the hypertable's time index from the newest chunk and
+        # stops at the first row, where MAX() may aggregate across every chunk.
+        query = text(
+            f'SELECT "{time_column}" FROM "{schema}"."{table}" '
+            f'WHERE "{time_column}" IS NOT NULL ORDER BY "{time_column}" DESC LIMIT 1'
+        )
         with self.Session() as session:
             try:
                 result = session.execute(query).scalar()
@@ -184,6 +244,26 @@ class DataAccess:
                 self.logger.error(f"Error inserting data: {e}")
                 raise
 
+    def insert_frame(self, data: pd.DataFrame) -> None:
+        """
+        Inserts OHLCV rows from a DataFrame with a single COPY, for bulk loads where
+        building one ORM object per row would dominate. Rows already in the table are skipped.
+
+        Args:
+            data (pd.DataFrame): OHLCV rows with time, symbol, open, high, low, close, and volume columns.
+
+        Raises:
+            Exception: If an error occurs during the copy; nothing is inserted.
+        """
+        try:
+            rows_inserted: int = bulk_insert_ohlcv(self.engine, data)
+            self.logger.info(
+                f"Copied {len(data)} records; inserted {rows_inserted}, skipped {len(data) - rows_inserted} duplicates."
+            )
+        except Exception as e:
+            self.logger.error(f"Error copying data: {e}")
+            raise
+
     def delete_data(
         self, 
         start_date: str, 
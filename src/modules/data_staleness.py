@@ -1,16 +1,39 @@
 #17
 
 from airflow.providers.postgres.hooks.postgres import PostgresHook
-from datetime import datetime, timedelta
+from datetime import timedelta
+import copy
+from functools import lru_cache
 import logging
+import os
+import pandas as pd
 import yaml
 
+CONFIG_PATH = "config.yaml"
+
+# Rows fetched per round trip by the server-side gap-scan cursor
+GAP_SCAN_ITERSIZE = 10_000
+
+# Prefer the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
+@lru_cache(maxsize=1)
+def _load_config_cached(path: str, mtime_ns: int) -> dict:
+    """
+    Parse the config file; cached per (path, mtime) so an edited file is re-read.
+    """
+    with open(path, "r") as file:
+        return yaml.load(file, Loader=YamlLoader)
+
 def load_config() -> dict:
     """
     Load configuration from the config.yaml file.
     """
-    with open("config.yaml", "r") as file:
-        return yaml.safe_load(file)
+    # Hand each caller its own copy so mutating it cannot leak into the cache
+    return copy.deepcopy(_load_config_cached(CONFIG_PATH, os.stat(CONFIG_PATH).st_mtime_ns))
 
 def check_data_staleness_and_gaps() -> None:
     """
@@ -31,8 +54,11 @@ def check_data_staleness_and_gaps() -> None:
         
         # Check for the latest timestamp (for staleness check)
         query_latest = f"""
-        SELECT MAX(timestamp_column)
-        FROM {table};
+        SELECT timestamp_column
+        FROM {table}
+        WHERE timestamp_column IS NOT NULL
+        ORDER BY timestamp_column DESC
+        LIMIT 1;
         """
         latest_timestamp = hook.get_first(query_latest)
         
@@ -41,8 +67,12 @@ def check_data_staleness_and_gaps() -> None:
             logging.info(f"Latest data timestamp: {latest_timestamp}")
             
             # Check if the data is stale (comparing with the current time or configured time range)
-            current_time = datetime.now()
-            time_diff = current_time - latest_timestamp
+            # Compare in UTC so tz-aware and naive (UTC-stored) columns both work
+            latest_timestamp_utc = pd.Timestamp(latest_timestamp)
+            if latest_timestamp_utc.tzinfo is None:
+                latest_timestamp_utc = latest_timestamp_utc.tz_localize("UTC")
+            current_time = pd.Timestamp.now(tz="UTC")
+            time_diff = current_time - latest_timestamp_utc
             logging.info(f"Data staleness check - Time difference: {time_diff}")
             
             if time_diff > timedelta(days=1):  # If the data is older than 1 day
@@ -53,25 +83,34 @@ def check_data_staleness_and_gaps() -> None:
             logging.warning("No data found in the database.")
         
         # Check for gaps in data
-        # Assuming the data is stored in daily frequency
+        # Assuming the data is stored in daily frequency; LAG() lets Postgres compare
+        # consecutive rows so only the gaps themselves are sent back
         query_gaps = f"""
-        SELECT timestamp_column
-        FROM {table}
-        ORDER BY timestamp_column;
+        SELECT ts, prev_ts
+        FROM (
+            SELECT timestamp_column AS ts,
+                   LAG(timestamp_column) OVER (ORDER BY timestamp_column) AS prev_ts
+            FROM {table}
+        ) AS consecutive
+        WHERE ts - prev_ts > INTERVAL '1 day'
+        ORDER BY ts;
         """
         
-        data = hook.get_records(query_gaps)
-        
-        if data:
-            # Iterate through the results and check for gaps
-            previous_timestamp = None
-            for row in data:
-                current_timestamp = row[0]
-                if previous_timestamp and (current_timestamp - previous_timestamp > timedelta(days=1)):
+        # Stream the gaps through a server-side cursor instead of materializing them all
+        gap_count = 0
+        connection = hook.get_conn()
+        try:
+            with connection.cursor(name="gap_scan") as cursor:
+                cursor.itersize = GAP_SCAN_ITERSIZE
+                cursor.execute(query_gaps)
+                for current_timestamp, previous_timestamp in cursor:
+                    gap_count += 1
                     logging.warning(f"Data gap detected between {previous_timestamp} and {current_timestamp}")
-                previous_timestamp = current_timestamp
-        else:
-            logging.warning("No records found to check for gaps.")
+        finally:
+            connection.close()
+
+        if not gap_count:
+            logging.info("No data gaps detected.")
     except Exception as e:
         logging.error(f"Error during data staleness and gap check: {e}")
         raise
@@ -5,7 +5,11 @@ from sqlalchemy.engine.base import Engine
 from sqlalchemy.orm.session import Session
 from typing import Dict, Any, Optional
 from dotenv import load_dotenv
+from functools import lru_cache
+import io
 import os
+import pandas as pd
+from src.modules.pg_copy import copy_skip_duplicates
 
 # Base class for SQLAlchemy models
 Base = declarative_base()
@@ -36,10 +40,41 @@ class OHLCV(Base):
     volume: Column = Column(Integer, nullable=False)
 
 
+@lru_cache(maxsize=1)
+def _load_environment() -> None:
+    """
+    Load environment variables from the `.env` file once per process.
+    """
+    load_dotenv()
+
+
+# Engines built by get_engine, keyed by connection string; released by dispose_engines
+_engines: Dict[str, Engine] = {}
+
+
+def _create_engine(connection_string: str) -> Engine:
+    """
+    Create one Engine (and connection pool) per connection string and reuse it.
+    """
+    engine: Optional[Engine] = _engines.get(connection_string)
+    if engine is None:
+        engine = _engines[connection_string] = create_engine(connection_string)
+    return engine
+
+
+@lru_cache(maxsize=None)
+def _session_factory(engine: Engine) -> sessionmaker:
+    """
+    Build the session factory for an engine once and reuse it.
+    """
+    return sessionmaker(bind=engine)
+
+
 def get_engine(config: Optional[Dict[str, Any]] = None) -> Engine:
     """
     Create and configure a SQLAlchemy Engine to connect to the TimescaleDB database.
-    Database credentials are loaded from a `.env` file.
+    Database credentials are loaded from a `.env` file. Engines are shared per connection
+    string, so repeated calls reuse the same connection pool.
 
     Environment Variables:
         - DB_USER (str): The username for database authentication.
@@ -55,7 +90,7 @@ def get_engine(config: Optional[Dict[str, Any]] = None) -> Engine:
         ValueError: If any required environment variable is missing.
     """
     # Load environment variables from .env file
-    load_dotenv()
+    _load_environment()
 
     # Retrieve database connection parameters from environment variables
     db_user: Optional[str] = os.getenv("DB_USER")
@@ -77,8 +112,21 @@ def get_engine(config: Optional[Dict[str, Any]] = None) -> Engine:
         f"postgresql://{db_user}:{db_password}@{db_host}:{db_port}/{db_name}"
     )
 
-    # Create and return the SQLAlchemy Engine
-    return create_engine(connection_string)
+    # Create (or reuse) and return the SQLAlchemy Engine
+    return _create_engine(connection_string)
+
+
+def dispose_engines() -> None:
+    """
+    Close the connection pools of every engine created by get_engine and forget them, along
+    with their session factories and the loaded `.env`, so the next get_engine call builds a
+    fresh engine. Use after the DB_* environment changes, or to isolate tests.
+    """
+    for engine in _engines.values():
+        engine.dispose()
+    _engines.clear()
+    _session_factory.cache_clear()
+    _load_environment.cache_clear()
 
 
 def get_session(engine: Engine) -> Session:
@@ -91,5 +139,50 @@ def get_session(engine: Engine) -> Session:
     Returns:
         Session: A SQLAlchemy Session object for executing database queries.
     """
-    SessionFactory = sessionmaker(bind=engine)
+    SessionFactory = _session_factory(engine)
     return SessionFactory()
+
+
+def bulk_insert_ohlcv(engine: Engine, data: pd.DataFrame) -> int:
+    """
+    Bulk-insert OHLCV rows with a single PostgreSQL COPY, bypassing ORM object mapping.
+    Rows whose (time, symbol) key already exists are skipped, as with every other insert path.
+
+    Args:
+        engine (Engine): A SQLAlchemy Engine object connected to the database.
+        data (pd.DataFrame): Rows with the OHLCV model's columns (time, symbol, open, high,
+            low, close, volume). Extra columns are ignored.
+
+    Returns:
+        int: The number of rows inserted, excluding skipped duplicates.
+
+    Raises:
+        KeyError: If a model column is missing from the data.
+        Exception: Any database error raised by the driver; the transaction is rolled back.
+    """
+    table = OHLCV.__table__
+    columns = [column.name for column in table.columns]
+
+    # Serialize once into an in-memory CSV buffer that COPY streams to the server
+    buffer = io.StringIO()
+    data[columns].to_csv(buffer, index=False, header=False)
+    buffer.seek(0)
+
+    connection = engine.raw_connection()
+    try:
+        cursor = connection.cursor()
+        try:
+            # The staging table goes away with the transaction, whether it commits or rolls back
+            rows_inserted = copy_skip_duplicates(
+                cursor, buffer, table.schema, table.name, columns, on_commit_drop=True
+            )
+        finally:
+            cursor.close()
+        connection.commit()
+    except Exception:
+        connection.rollback()
+        raise
+    finally:
+        connection.close()
+
+    return rows_inserted
@@ -5,6 +5,7 @@ from typing import List, Dict, Any, Optional
 import databento as db
 import pandas as pd
 from src.modules.fetcher.fetcher import Fetcher
+from src.modules.fetcher.databento_fetcher import DEFAULT_POOL_SIZE, get_client, resolve_schema
 from datetime import timedelta   # New Import
 import datetime # NEW IMPORT
 
@@ -22,34 +23,45 @@ class BatchDownloadDatabentoFetcher(Fetcher):
         """
         super().__init__(config)
         api_key: str = os.getenv("DATABENTO_API_KEY")
-        self.client: db.Historical = db.Historical(api_key)
+        self.client: db.Historical = get_client(api_key)
+        self.pool_size: int = int(self.config.get("provider", {}).get("pool_size", DEFAULT_POOL_SIZE))
         self.logger: logging.Logger = logging.getLogger("BatchDownloadDatabentoFetcher")
         self.logger.setLevel(logging.INFO)
 
     async def generate_and_fetch_data(self, symbol: str, loaded_asset_type: str,start_date: str, end_date: str,unit: str, max_units_allowed: int):
-        master_df = pd.DataFrame()
-
         batches = self.generate_batches(start_date,end_date, unit,max_units_allowed)
 
-        for batch in batches:
-             self.logger.info(
-                 "Starting batch fetch for symbol=%s loaded_asset_type=%s batch_start=%s batch_end=%s",
-                 symbol,
-                 loaded_asset_type,
-                 batch[0],
-                 batch[1],
-             )
-             data = await self.fetch_data(symbol, loaded_asset_type, start_date=batch[0], end_date=batch[1])
-             self.logger.info(
-                 "Successfully fetched batch for symbol=%s from %s to %s. rows=%d",
-                 symbol,
-                 batch[0],
-                 batch[1],
-                 len(data),
-             )
-             master_df = pd.concat([data, master_df], ignore_index=True)
-
-        return master_df
+        # Batches are independent requests: run up to pool_size of them at once
+        semaphore = asyncio.Semaphore(self.pool_size)
+
+        async def fetch_batch(batch: List[str]) -> pd.DataFrame:
+            async with semaphore:
+                self.logger.info(
+                    "Starting batch fetch for symbol=%s loaded_asset_type=%s batch_start=%s batch_end=%s",
+                    symbol,
+                    loaded_asset_type,
+                    batch[0],
+                    batch[1],
+                )
+                data = await self.fetch_data(symbol, loaded_asset_type, start_date=batch[0], end_date=batch[1])
+                self.logger.info(
+                    "Successfully fetched batch for symbol=%s from %s to %s. rows=%d",
+                    symbol,
+                    batch[0],
+                    batch[1],
+                    len(data),
+                )
+                return data
+
+        # gather preserves batch order, so the frames stay chronological
+        results: List[pd.DataFrame] = await asyncio.gather(*[fetch_batch(batch) for batch in batches])
+        batch_frames: List[pd.DataFrame] = [data for data in results if not data.empty]
+
+        # Concatenate once, in chronological batch order, instead of re-copying the
+        # accumulated frame for every batch
+        if not batch_frames:
+            return pd.DataFrame(columns=["time", "open", "high", "low", "close", "volume", "symbol"])
+        return pd.concat(batch_frames, ignore_index=True)
 
     
     def generate_batches(self, start_date: str, end_date: str, unit: str, max_units_allowed: int):
@@ -97,17 +109,17 @@ class BatchDownloadDatabentoFetcher(Fetcher):
         # Create the time delta for each batch.
         delta = pd.Timedelta(max_units_allowed, unit=time_unit)
 
-        batches = []
-        current_ts = start_ts
-
-        while current_ts < end_ts:
-            batch_end = current_ts + delta
-            if batch_end > end_ts:
-                batch_end = end_ts  
-            batches.append([current_ts.strftime(date_format), batch_end.strftime(date_format)])
-            current_ts = batch_end 
-       
-        return batches
+        # Every batch start before end_ts, with ends clipped to end_ts, built and formatted
+        # as whole arrays instead of one Timestamp at a time
+        batch_starts = pd.date_range(start=start_ts, end=end_ts, freq=delta)
+        batch_starts = batch_starts[batch_starts < end_ts]
+        batch_ends = batch_starts + delta
+        batch_ends = batch_ends.where(batch_ends < end_ts, end_ts)
+
+        return [
+            [batch_start, batch_end]
+            for batch_start, batch_end in zip(batch_starts.strftime(date_format), batch_ends.strftime(date_format))
+        ]
     
     async def fetch_data(
         self,
@@ -193,19 +205,23 @@ class BatchDownloadDatabentoFetcher(Fetcher):
             data = await self.client.timeseries.get_range_async(
                 dataset=dataset,
                 symbols=formatted_symbol,
-                schema=db.Schema.from_str(schema),
+                schema=resolve_schema(schema),
                 start=start_date,
                 end=end_date_exclusive,
                 stype_in=stype_in,
                 stype_out=stype_out,
             )
-            # Convert to DataFrame
-            df = data.to_df()
+            # Decode off the event loop so concurrent batches keep downloading
+            # map_symbols=False skips the per-row instrument-ID -> symbol lookup; the symbol
+            # column is overwritten with the requested symbol below anyway
+            df = await asyncio.to_thread(data.to_df, map_symbols=False)
 
             # IMPORTANT: This controls what ultimately gets inserted into the DB.
             # For futures, df["symbol"] will be something like MES.v.0; for non-remapped
             # futures (e.g. 6A) it will be 6A.v.0; for equities it is the raw symbol.
-            df["symbol"] = formatted_symbol
+            # Dictionary-encode the symbol: one stored string plus int8 codes instead of a
+            # Python string per row
+            df["symbol"] = pd.Series(formatted_symbol, index=df.index, dtype="category")
             self.logger.info(
                 "Setting DataFrame symbol column (batch). original_symbol=%s formatted_symbol=%s stored_symbol=%s "
                 "unique_symbols_in_df_sample=%s",
@@ -217,7 +233,7 @@ class BatchDownloadDatabentoFetcher(Fetcher):
 
             # Check if data is empty
             if df.empty:
-                self.logger.warning(f"No data found for {symbol} between {start_date} and {end_date}")
+                self.logger.warning("No data found for %s between %s and %s", symbol, start_date, end_date)
                 return pd.DataFrame(columns=["time", "open", "high", "low", "close", "volume", "symbol"])
 
             if "ts_event" in df.index.names:
@@ -233,7 +249,7 @@ class BatchDownloadDatabentoFetcher(Fetcher):
 
 
         except Exception as e:
-            self.logger.error(f"Error fetching data for {symbol}: {e}")
+            self.logger.error("Error fetching data for %s: %s", symbol, e)
             raise    
 
 
@@ -297,7 +313,7 @@ class BatchDownloadDatabentoFetcher(Fetcher):
                 async for record in await self.client.timeseries.get_range_async(
                     dataset=dataset,
                     symbols=formatted_symbol,
-                    schema=db.Schema.from_str(schema),
+                    schema=resolve_schema(schema),
                     start=start_date,
                     end=end_date,
                     stype_in=stype_in,
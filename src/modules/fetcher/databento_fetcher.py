@@ -1,11 +1,45 @@
 import asyncio
 import os
 import logging
-from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Union
 import databento as db
 import pandas as pd
 from src.modules.fetcher.fetcher import Fetcher
+from src.modules.cache import FileCache
+
+# Default cap on concurrent Databento requests issued by fetch_many
+DEFAULT_POOL_SIZE: int = 10
+
+
+@lru_cache(maxsize=None)
+def resolve_schema(schema: str) -> db.Schema:
+    """
+    Resolves a schema name such as "ohlcv-1d" to its Databento enum, once per name.
+
+    Args:
+        schema (str): The configured schema name.
+
+    Returns:
+        db.Schema: The matching Databento schema.
+    """
+    return db.Schema.from_str(schema)
+
+
+@lru_cache(maxsize=None)
+def get_client(api_key: Optional[str]) -> db.Historical:
+    """
+    Returns the Historical client for an API key, creating it on first use so that every
+    fetcher in the process shares one client and its HTTP connection pool.
+
+    Args:
+        api_key (Optional[str]): The Databento API key.
+
+    Returns:
+        db.Historical: The shared client.
+    """
+    return db.Historical(api_key)
 
 
 class DatabentoFetcher(Fetcher):
@@ -22,7 +56,19 @@ class DatabentoFetcher(Fetcher):
         """
         super().__init__(config)
         api_key: str = os.getenv("DATABENTO_API_KEY")
-        self.client: db.Historical = db.Historical(api_key)
+        self.client: db.Historical = get_client(api_key)
+        self.pool_size: int = int(self.config.get("provider", {}).get("pool_size", DEFAULT_POOL_SIZE))
+
+        # Optional on-disk cache of completed date ranges
+        cache_config: Dict[str, Any] = self.config.get("cache") or {}
+        self.cache: Optional[FileCache] = None
+        if cache_config.get("enabled"):
+            self.cache = FileCache(
+                cache_dir=cache_config.get("dir", ".cache/databento"),
+                ttl_days=cache_config.get("ttl_days", 90),
+            )
+        # Empty results expire sooner: a recent range may be empty only because it is not published yet
+        self.empty_cache_ttl: timedelta = timedelta(hours=float(cache_config.get("empty_ttl_hours", 24)))
         self.logger: logging.Logger = logging.getLogger("DatabentoFetcher")
         self.logger.setLevel(logging.INFO)
 
@@ -104,24 +150,48 @@ class DatabentoFetcher(Fetcher):
         # inclusive end_date semantics are preserved at the API boundary.
         end_date_exclusive = (datetime.strptime(end_date, "%Y-%m-%d") + timedelta(days=1)).strftime("%Y-%m-%d")
 
+        # Only ranges that ended before today are final; today's bar may still change
+        cache_key: Optional[str] = None
+        if self.cache is not None and end_date < datetime.now(timezone.utc).strftime("%Y-%m-%d"):
+            cache_key = FileCache.make_key({
+                "dataset": dataset,
+                "schema": schema,
+                "symbol": formatted_symbol,
+                "stype_in": stype_in,
+                "stype_out": stype_out,
+                "start": start_date,
+                "end": end_date_exclusive,
+            })
+            cached: Optional[pd.DataFrame] = await asyncio.to_thread(self.cache.get, cache_key, formatted_symbol)
+            if cached is not None:
+                if cached.empty:
+                    self.logger.warning("No data found for %s between %s and %s (cached)", symbol, start_date, end_date)
+                    return cached
+                self.logger.info("Cache hit for %s between %s and %s. rows=%d", symbol, start_date, end_date, len(cached))
+                return cached
+
         try:
             # Fetch data
             data = await self.client.timeseries.get_range_async(
                 dataset=dataset,
                 symbols=formatted_symbol,
-                schema=db.Schema.from_str(schema),
+                schema=resolve_schema(schema),
                 start=start_date,
                 end=end_date_exclusive,
                 stype_in=stype_in,
                 stype_out=stype_out,
             )
-            # Convert to DataFrame
-            df = data.to_df()
+            # Convert to DataFrame off the event loop so other responses keep streaming in
+            # map_symbols=False skips the per-row instrument-ID -> symbol lookup; the symbol
+            # column is overwritten with the requested symbol below anyway
+            df = await asyncio.to_thread(data.to_df, map_symbols=False)
 
             # IMPORTANT: This controls what ultimately gets inserted into the DB.
             # For futures, df["symbol"] will be something like MES.v.0; for non-remapped
             # futures (e.g. 6A) it will be 6A.v.0; for equities it is the raw symbol.
-            df["symbol"] = formatted_symbol
+            # Dictionary-encode the symbol: one stored string plus int8 codes instead of a
+            # Python string per row
+            df["symbol"] = pd.Series(formatted_symbol, index=df.index, dtype="category")
             self.logger.info(
                 "Setting DataFrame symbol column. original_symbol=%s formatted_symbol=%s stored_symbol=%s "
                 "unique_symbols_in_df_sample=%s",
@@ -133,8 +203,12 @@ class DatabentoFetcher(Fetcher):
 
             # Check if data is empty
             if df.empty:
-                self.logger.warning(f"No data found for {symbol} between {start_date} and {end_date}")
-                return pd.DataFrame(columns=["time", "open", "high", "low", "close", "volume", "symbol"])
+                self.logger.warning("No data found for %s between %s and %s", symbol, start_date, end_date)
+                empty_df = pd.DataFrame(columns=["time", "open", "high", "low", "close", "volume", "symbol"])
+                if cache_key is not None:
+                    # Negative cache: skip the round trip for repeat requests of an empty range
+                    await asyncio.to_thread(self.cache.put, cache_key, empty_df, formatted_symbol, self.empty_cache_ttl)
+                return empty_df
 
             if "ts_event" in df.index.names:
                 df.reset_index(inplace=True)
@@ -145,9 +219,47 @@ class DatabentoFetcher(Fetcher):
                 len(df),
                 list(df.columns),
             )
+
+            if cache_key is not None:
+                await asyncio.to_thread(self.cache.put, cache_key, df, formatted_symbol)
             return df
 
         except Exception as e:
-            self.logger.error(f"Error fetching data for {symbol}: {e}")
+            self.logger.error("Error fetching data for %s: %s", symbol, e)
             raise
-        
\ No newline at end of file
+        
+    async def fetch_many(
+        self,
+        symbols: List[str],
+        loaded_asset_type: str,
+        start_date: str,
+        end_date: str,
+    ) -> List[Union[pd.DataFrame, BaseException]]:
+        """
+        Asynchronously fetches historical data for several symbols, issuing up to
+        `pool_size` requests concurrently.
+
+        Args:
+            symbols (List[str]): The symbols to fetch data for.
+            loaded_asset_type (str): Type of asset to load (e.g., "FUTURE")
+            start_date (str): Start date for fetching.
+            end_date (str): End date for fetching.
+
+        Returns:
+            List[Union[pd.DataFrame, BaseException]]: One entry per symbol, in input order. A failed
+            fetch yields its exception instead of cancelling the remaining requests.
+        """
+        # Bound in-flight requests so a large universe does not swamp the endpoint
+        semaphore = asyncio.Semaphore(self.pool_size)
+
+        async def bounded_fetch(symbol: str) -> pd.DataFrame:
+            async with semaphore:
+                return await self.fetch_data(symbol, loaded_asset_type, start_date, end_date)
+
+        tasks = [bounded_fetch(symbol) for symbol in symbols]
+        results: List[Union[pd.DataFrame, BaseException]] = await asyncio.gather(*tasks, return_exceptions=True)
+
+        failed: List[str] = [symbol for symbol, result in zip(symbols, results) if isinstance(result, BaseException)]
+        if failed:
+            self.logger.warning("Failed to fetch %d of %d symbols: %s", len(failed), len(symbols), failed)
+        return results
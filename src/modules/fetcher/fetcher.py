@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
 from typing import List, Dict, Any
 import logging
+import numpy as np
 import pandas as pd
 
 
@@ -56,20 +57,17 @@ class Fetcher(ABC):
         Returns:
             List[str]: A list of missing time periods (timestamps).
         """
-        # Convert the fetched data into a pandas DataFrame for easier processing
-        df = pd.DataFrame(data)
-        
-        if time_column not in df.columns:
+        if not any(time_column in row for row in data):
             raise ValueError(f"Time column '{time_column}' not found in the fetched data.")
 
-        df[time_column] = pd.to_datetime(df[time_column])
-        df = df.sort_values(by=time_column)
+        # Parse only the time column; cache=True parses each repeated string once
+        times = pd.DatetimeIndex(pd.to_datetime([row.get(time_column) for row in data], cache=True))
 
-        # Generate a complete time range based on the desired frequency
-        time_range = pd.date_range(start=df[time_column].min(), end=df[time_column].max(), freq=freq)
+        # Generate a complete time range based on the desired frequency. min/max need no sort.
+        time_range = pd.date_range(start=times.min(), end=times.max(), freq=freq)
 
-        # Find missing timestamps
-        missing_timestamps = time_range.difference(df[time_column])
+        # Find missing timestamps by comparing int64 nanosecond views
+        missing_timestamps = time_range[~np.isin(time_range.asi8, times.asi8)]
 
         return missing_timestamps.astype(str).tolist()
 
@@ -82,7 +80,7 @@ class Fetcher(ABC):
         """
         if missing_timestamps:
             for timestamp in missing_timestamps:
-                self.logger.warning(f"Missing data at timestamp: {timestamp}")
+                self.logger.warning("Missing data at timestamp: %s", timestamp)
         else:
             self.logger.info("No missing data detected.")
 
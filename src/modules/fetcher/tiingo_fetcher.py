@@ -7,6 +7,12 @@ import pandas as pd
 from typing import Dict, Any, List, Optional
 from dotenv import load_dotenv
 
+# Prefer orjson's faster parser for the JSON payloads when it is installed
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
 # Reuse the existing Fetcher base class
 from src.modules.fetcher.fetcher import Fetcher
 
@@ -92,6 +98,23 @@ class TiingoFetcher(Fetcher):
         )
         self._semaphore: Optional[asyncio.Semaphore] = None
 
+        # One pooled HTTP session shared by every request, so keep-alive connections
+        # are reused across symbols instead of paying a TCP + TLS handshake per call.
+        # Created lazily for the same event-loop reason as the semaphore.
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    async def __aenter__(self) -> "TiingoFetcher":
+        return self
+
+    async def __aexit__(self, *exc: Any) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the shared HTTP session (and its pooled connections), if open."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
     def _get_semaphore(self) -> asyncio.Semaphore:
         """Lazily create the concurrency semaphore in the running event loop.
         Safe without a lock: asyncio is single-threaded and there is no await
@@ -100,6 +123,12 @@ class TiingoFetcher(Fetcher):
             self._semaphore = asyncio.Semaphore(self._max_concurrency)
         return self._semaphore
 
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Lazily create the shared HTTP session in the running event loop."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(timeout=REQUEST_TIMEOUT)
+        return self._session
+
     @staticmethod
     def _collect_api_keys() -> List[str]:
         """Collect every non-empty env var named TIINGO_API_KEY* in deterministic
@@ -143,7 +172,7 @@ class TiingoFetcher(Fetcher):
         start = self._primary_index(symbol)
         last_error = None
 
-        logger.info(f"[Tiingo] Fetching EOD data for {symbol} from {start_date} to {end_date}")
+        logger.info("[Tiingo] Fetching EOD data for %s from %s to %s", symbol, start_date, end_date)
 
         # Throttle: only self._max_concurrency requests are in flight at once across
         # all symbols, preventing the connection-saturation timeouts and 429 bursts
@@ -155,22 +184,21 @@ class TiingoFetcher(Fetcher):
                 if key in self._disabled_keys:
                     continue
                 params = {**base_params, "token": key}
-                async with aiohttp.ClientSession(timeout=REQUEST_TIMEOUT) as session:
-                    async with session.get(url, params=params) as response:
-                        if response.status == 200:
-                            data = await response.json()
-                            return self._to_dataframe(data, symbol)
-                        body = await response.text()
-                        if response.status in KEY_LEVEL_FAILURES:
-                            logger.warning(
-                                f"[Tiingo] key #{idx} unusable for {symbol} "
-                                f"(HTTP {response.status}); rotating to next key"
-                            )
-                            self._disabled_keys.add(key)
-                            last_error = f"HTTP {response.status}: {body}"
-                            continue
-                        # Non-key error (5xx, etc.): fail this symbol, don't burn the key.
-                        raise RuntimeError(f"[Tiingo] HTTP {response.status} for {symbol}: {body}")
+                async with self._get_session().get(url, params=params) as response:
+                    if response.status == 200:
+                        data = await response.json(loads=json_loads)
+                        return self._to_dataframe(data, symbol)
+                    body = await response.text()
+                    if response.status in KEY_LEVEL_FAILURES:
+                        logger.warning(
+                            f"[Tiingo] key #{idx} unusable for {symbol} "
+                            f"(HTTP {response.status}); rotating to next key"
+                        )
+                        self._disabled_keys.add(key)
+                        last_error = f"HTTP {response.status}: {body}"
+                        continue
+                    # Non-key error (5xx, etc.): fail this symbol, don't burn the key.
+                    raise RuntimeError(f"[Tiingo] HTTP {response.status} for {symbol}: {body}")
 
         if last_error is None:
             raise RuntimeError(
@@ -184,21 +212,22 @@ class TiingoFetcher(Fetcher):
     def _to_dataframe(self, data: Any, symbol: str) -> pd.DataFrame:
         """Map Tiingo JSON to the persisted column set (rename + trim + tag symbol)."""
         if not data:
-            logger.warning(f"[Tiingo] No data returned for {symbol}")
+            logger.warning("[Tiingo] No data returned for %s", symbol)
             return pd.DataFrame(columns=OUTPUT_COLUMNS)
 
         df = pd.DataFrame(data)
         df.rename(columns=RENAME_MAP, inplace=True)
-        df["symbol"] = symbol
+        # Dictionary-encode the constant symbol instead of storing one string per row
+        df["symbol"] = pd.Series(symbol, index=df.index, dtype="category")
 
-        missing = [c for c in OUTPUT_COLUMNS if c not in df.columns]
+        missing = pd.Index(OUTPUT_COLUMNS).difference(df.columns, sort=False).tolist()
         if missing:
             raise RuntimeError(
                 f"[Tiingo] Response for {symbol} missing expected fields {missing}. "
                 f"Got columns: {list(df.columns)}"
             )
         df = df[OUTPUT_COLUMNS].copy()
-        logger.info(f"[Tiingo] Fetched {len(df)} rows for {symbol}")
+        logger.info("[Tiingo] Fetched %s rows for %s", len(df), symbol)
         return df
 
 
@@ -208,9 +237,9 @@ if __name__ == "__main__":
     import asyncio
 
     async def _smoke():
-        fetcher = TiingoFetcher(config={"provider": {"asset": "EQUITY"}})
-        print(f"Collected {len(fetcher.api_keys)} key(s)")
-        df = await fetcher.fetch_data("AAPL", "EQUITY", "2024-01-02", "2024-01-05")
+        async with TiingoFetcher(config={"provider": {"asset": "EQUITY"}}) as fetcher:
+            print(f"Collected {len(fetcher.api_keys)} key(s)")
+            df = await fetcher.fetch_data("AAPL", "EQUITY", "2024-01-02", "2024-01-05")
         print(df)
         print("columns:", list(df.columns))
 
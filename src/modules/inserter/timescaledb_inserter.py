@@ -1,17 +1,124 @@
+import atexit
+import io
+import operator
 import os
 import psycopg2
-from typing import List, Dict, Any, Optional
+import pyarrow as pa
+import pyarrow.csv as pacsv
+from functools import lru_cache
+from psycopg2 import sql
+from psycopg2.extras import execute_values
+from psycopg2.pool import PoolError, ThreadedConnectionPool
+from typing import List, Dict, Any, Optional, Set, Tuple
 from src.modules.inserter.inserter import Inserter
+from src.modules.pg_copy import copy_skip_duplicates
 import logging
 
+logger = logging.getLogger(__name__)
+
+# Rows packed into each multi-row INSERT statement by insert_data
+INSERT_PAGE_SIZE: int = 1000
+
+# Default cap on open connections per database pool
+DEFAULT_POOL_MAX_CONNECTIONS: int = 8
+
+
+@lru_cache(maxsize=None)
+def get_pool(
+    dbname: Optional[str],
+    user: Optional[str],
+    password: Optional[str],
+    host: Optional[str],
+    port: Optional[str],
+    max_connections: int = DEFAULT_POOL_MAX_CONNECTIONS,
+) -> ThreadedConnectionPool:
+    """
+    Returns the connection pool for a set of connection parameters, creating it on first use
+    so that every inserter in the process reuses already-authenticated connections.
+
+    The server endpoint is logged once, when the pool is created.
+
+    Args:
+        dbname (Optional[str]): The database name.
+        user (Optional[str]): The database user.
+        password (Optional[str]): The user's password.
+        host (Optional[str]): The database host.
+        port (Optional[str]): The database port.
+        max_connections (int): Maximum number of connections the pool keeps open.
+
+    Returns:
+        ThreadedConnectionPool: The shared pool.
+
+    Raises:
+        psycopg2.OperationalError: If the first connection cannot be established.
+    """
+    pool = ThreadedConnectionPool(
+        minconn=1,
+        maxconn=max_connections,
+        dbname=dbname,
+        user=user,
+        password=password,
+        host=host,
+        port=port,
+    )
+    atexit.register(pool.closeall)
+
+    connection = pool.getconn()
+    try:
+        connection.autocommit = True
+        with connection.cursor() as cur:
+            cur.execute("SELECT inet_server_addr(), inet_server_port(), current_database(), current_user")
+            host, port, dbname, dbuser = cur.fetchone()
+            logger.info("DB endpoint -> host=%s port=%s db=%s user=%s", host, port, dbname, dbuser)
+
+            cur.execute("SHOW search_path")
+            sp = cur.fetchone()[0]
+            logger.info("search_path=%s", sp)
+
+            cur.execute("""
+                SELECT schema_name FROM information_schema.schemata ORDER BY schema_name
+            """)
+            schemas = [r[0] for r in cur.fetchall()]
+            logger.info("Schemas present: %s", ", ".join(schemas))
+    finally:
+        pool.putconn(connection)
+    return pool
+
+
+@lru_cache(maxsize=None)
+def _insert_query(schema: str, table: str, columns: Tuple[str, ...]) -> sql.Composed:
+    """
+    Returns the multi-row INSERT for a target and column list, composed once per
+    (schema, table, columns) with quoted identifiers. execute_values expands its single
+    VALUES %s into one tuple per row, INSERT_PAGE_SIZE rows per statement.
+
+    Args:
+        schema (str): The target schema in TimescaleDB.
+        table (str): The target table in TimescaleDB.
+        columns (Tuple[str, ...]): The columns supplied for each row, in tuple order.
+
+    Returns:
+        sql.Composed: The INSERT query.
+    """
+    return sql.SQL("""
+    INSERT INTO {target} ({columns})
+    VALUES %s
+    ON CONFLICT DO NOTHING;
+    """).format(
+        target=sql.Identifier(schema, table),
+        columns=sql.SQL(", ").join(map(sql.Identifier, columns)),
+    )
+
+
 class TimescaleDBInserter(Inserter):
     """
     Inserter subclass for dynamically inserting data into TimescaleDB.
 
     Methods:
-        connect: Establish a connection to the TimescaleDB database.
+        connect: Check out a pooled connection to the TimescaleDB database.
         insert_data: Insert data into the specified schema and table dynamically.
-        close: Close the database connection.
+        insert_arrow: Bulk-insert an Arrow table with COPY.
+        close: Return the database connection to the pool.
     """
 
     def __init__(self, config: Dict[str, Any]) -> None:
@@ -23,60 +130,56 @@ class TimescaleDBInserter(Inserter):
         """
         super().__init__(config=config)
         self.connection = None
+        self.pool: Optional[ThreadedConnectionPool] = None
+        self._verified_targets: Set[Tuple[str, str]] = set()
         self.logger = logging.getLogger(self.__class__.__name__)
         self.logger.setLevel(logging.INFO)
 
     def connect(self) -> None:
         """
-        Establishes a connection to the TimescaleDB database.
+        Checks out a connection to the TimescaleDB database from the shared pool. Calling
+        connect again while a connection is held keeps the current one.
 
         Raises:
             ConnectionError: If the connection to the database fails.
         """
+        if self.connection is not None:
+            return
         try:
             target_db = self.config.get("database", {}).get("db_name")
-            self.connection = psycopg2.connect(
-                dbname=target_db,
-                user=os.getenv("DB_USER"),
-                password=os.getenv("DB_PASSWORD"),
-                host=os.getenv("DB_HOST"),
-                port=os.getenv("DB_PORT")
+            max_connections = int(
+                self.config.get("database", {}).get("pool_size") or DEFAULT_POOL_MAX_CONNECTIONS
+            )
+            self.pool = get_pool(
+                target_db,
+                os.getenv("DB_USER"),
+                os.getenv("DB_PASSWORD"),
+                os.getenv("DB_HOST"),
+                os.getenv("DB_PORT"),
+                max_connections,
             )
+            self.connection = self.pool.getconn()
             self.connection.autocommit = True
-            with self.connection.cursor() as cur:
-                cur.execute("SELECT inet_server_addr(), inet_server_port(), current_database(), current_user")
-                host, port, dbname, dbuser = cur.fetchone()
-                self.logger.info("DB endpoint -> host=%s port=%s db=%s user=%s", host, port, dbname, dbuser)
-
-                cur.execute("SHOW search_path")
-                sp = cur.fetchone()[0]
-                self.logger.info("search_path=%s", sp)
-
-                cur.execute("""
-                    SELECT schema_name FROM information_schema.schemata ORDER BY schema_name
-                """)
-                schemas = [r[0] for r in cur.fetchall()]
-                self.logger.info("Schemas present: %s", ", ".join(schemas))
-                self.logger.info(f"Connected to TimescaleDB successfully for {dbname}.")
-        except psycopg2.OperationalError as e:
+            self.logger.info(f"Connected to TimescaleDB successfully for {target_db}.")
+        except (psycopg2.OperationalError, PoolError) as e:
             self.connection = None
             raise ConnectionError(f"Failed to connect to TimescaleDB: {e}")
 
-    def insert_data(self, data: List[Dict[str, Any]], schema: str, table: str) -> None:
+    def _verify_target(self, cur: Any, schema: str, table: str) -> None:
         """
-        Inserts data into the specified TimescaleDB schema and table dynamically.
+        Verifies that the target schema and table exist before inserting. A target that passed
+        is remembered, so later inserts into it skip the catalog queries.
 
         Args:
-            data (List[Dict[str, Any]]): A list of dictionaries representing data rows.
+            cur (Any): An open cursor on the current connection.
             schema (str): The target schema in TimescaleDB.
             table (str): The target table in TimescaleDB.
 
         Raises:
-            ValueError: If the data is empty or columns are not specified.
-            RuntimeError: If the insertion into the database fails.
+            RuntimeError: If the schema or table does not exist.
         """
-        if not self.connection:
-            raise RuntimeError("Database connection is not established.")
+        if (schema, table) in self._verified_targets:
+            return
         schema_exists_sql = """
         SELECT 1 FROM information_schema.schemata WHERE schema_name = %s
         """
@@ -84,39 +187,49 @@ class TimescaleDBInserter(Inserter):
         SELECT 1 FROM information_schema.tables
         WHERE table_schema = %s AND table_name = %s
         """
+        cur.execute(schema_exists_sql, (schema,))
+        if cur.fetchone() is None:
+            raise RuntimeError(
+                f"Target schema '{schema}' not found. You are likely on the wrong DB/host/port. "
+                "Check DB_HOST/DB_PORT in docker-compose for data-engine."
+            )
+        cur.execute(table_exists_sql, (schema, table))
+        if cur.fetchone() is None:
+            cur.execute("""
+                SELECT table_schema||'.'||table_name
+                FROM information_schema.tables
+                WHERE table_schema NOT IN ('pg_catalog','information_schema')
+                ORDER BY 1
+            """)
+            existing = [r[0] for r in cur.fetchall()]
+            raise RuntimeError(
+                f"Target table '{schema}.{table}' not found. Existing tables: {existing[:50]}"
+            )
+        self._verified_targets.add((schema, table))
+
+    def insert_data(self, data: List[Dict[str, Any]], schema: str, table: str) -> None:
+        """
+        Inserts data into the specified TimescaleDB schema and table dynamically.
+
+        Args:
+            data (List[Dict[str, Any]]): A list of dictionaries representing data rows.
+            schema (str): The target schema in TimescaleDB.
+            table (str): The target table in TimescaleDB.
 
+        Raises:
+            ValueError: If the data is empty or columns are not specified.
+            RuntimeError: If the insertion into the database fails.
+        """
+        if not self.connection:
+            raise RuntimeError("Database connection is not established.")
+        if not data:
+            raise ValueError("No data provided for insertion.")
         with self.connection.cursor() as cur:
-            cur.execute(schema_exists_sql, (schema,))
-            if cur.fetchone() is None:
-                raise RuntimeError(
-                    f"Target schema '{schema}' not found. You are likely on the wrong DB/host/port. "
-                    "Check DB_HOST/DB_PORT in docker-compose for data-engine."
-                )
-            cur.execute(table_exists_sql, (schema, table))
-            if cur.fetchone() is None:
-                cur.execute("""
-                    SELECT table_schema||'.'||table_name
-                    FROM information_schema.tables
-                    WHERE table_schema NOT IN ('pg_catalog','information_schema')
-                    ORDER BY 1
-                """)
-                existing = [r[0] for r in cur.fetchall()]
-                raise RuntimeError(
-                    f"Target table '{schema}.{table}' not found. Existing tables: {existing[:50]}"
-                )
+            self._verify_target(cur, schema, table)
 
         # Determine columns based on first row of data 
         columns = list(data[0].keys())
 
-        # Dynamically construct query based on provided columns
-        column_names = ", ".join(columns)
-        placeholders = ", ".join([f"%({col})s" for col in columns])
-        query = f"""
-        INSERT INTO {schema}.{table} ({column_names})
-        VALUES ({placeholders})
-        ON CONFLICT DO NOTHING;
-        """.strip()
-
         # Diagnostic logging: what symbols are we about to insert?
         if data and isinstance(data, list):
             sample_size = min(len(data), 5)
@@ -134,8 +247,17 @@ class TimescaleDBInserter(Inserter):
             )
 
         try:
+            # Pull each row's values positionally in one C-level call, so psycopg2 binds
+            # plain tuples instead of looking up every key in every row dict
+            row_values = operator.itemgetter(*columns)
+            if len(columns) == 1:
+                rows = [(value,) for value in map(row_values, data)]
+            else:
+                rows = list(map(row_values, data))
             with self.connection.cursor() as cursor:
-                cursor.executemany(query, data)
+                execute_values(
+                    cursor, _insert_query(schema, table, tuple(columns)), rows, page_size=INSERT_PAGE_SIZE
+                )
             self.logger.info(
                 "Inserted %d rows into %s.%s",
                 len(data),
@@ -144,17 +266,64 @@ class TimescaleDBInserter(Inserter):
             )
         except psycopg2.Error as e:
             self.connection.rollback()
+            # Check the target again next time in case it is what went away
+            self._verified_targets.discard((schema, table))
             self.logger.error("PG error code=%s detail=%s", getattr(e, "pgcode", None), getattr(getattr(e, "diag", None), "message_detail", None))
             raise RuntimeError(f"Failed to insert into {schema}.{table}: {e}")
         except Exception as e:
             self.connection.rollback()
             raise RuntimeError(f"Failed to insert data into {schema}.{table}: {e}")
 
+    def insert_arrow(self, data: pa.Table, schema: str, table: str) -> None:
+        """
+        Bulk-inserts an Arrow table into the specified TimescaleDB schema and table with COPY.
+
+        Rows are streamed into a temporary staging table with a single COPY and then moved into
+        the target with INSERT ... SELECT, so the ON CONFLICT DO NOTHING semantics of
+        insert_data are preserved.
+
+        Args:
+            data (pa.Table): Columnar data whose column names match the target table.
+            schema (str): The target schema in TimescaleDB.
+            table (str): The target table in TimescaleDB.
+
+        Raises:
+            ValueError: If the data is empty.
+            RuntimeError: If the insertion into the database fails.
+        """
+        if not self.connection:
+            raise RuntimeError("Database connection is not established.")
+        if data.num_rows == 0:
+            raise ValueError("No data provided for insertion.")
+
+        # Serialize every column once in Arrow's native CSV writer
+        buffer = io.BytesIO()
+        pacsv.write_csv(data, buffer, pacsv.WriteOptions(include_header=False))
+        buffer.seek(0)
+
+        try:
+            with self.connection.cursor() as cursor:
+                self._verify_target(cursor, schema, table)
+                copy_skip_duplicates(cursor, buffer, schema, table, data.column_names)
+            self.logger.info(
+                "Copied %d rows into %s.%s",
+                data.num_rows,
+                schema,
+                table,
+            )
+        except psycopg2.Error as e:
+            self.connection.rollback()
+            # Check the target again next time in case it is what went away
+            self._verified_targets.discard((schema, table))
+            self.logger.error("PG error code=%s detail=%s", getattr(e, "pgcode", None), getattr(getattr(e, "diag", None), "message_detail", None))
+            raise RuntimeError(f"Failed to copy into {schema}.{table}: {e}")
+
     def close(self) -> None:
         """
-        Closes the database connection if it is open.
+        Returns the database connection to the pool if one is held. Broken connections are
+        discarded rather than reused.
         """
         if self.connection:
-            self.connection.close()
+            self.pool.putconn(self.connection, close=bool(self.connection.closed))
             self.connection = None
-            self.logger.info("Database connection closed.")
\ No newline at end of file
+            self.logger.info("Database connection returned to the pool.")
\ No newline at end of file
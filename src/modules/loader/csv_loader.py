@@ -1,9 +1,12 @@
-import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
 import os
 import logging
 from typing import Dict, Any, List
 from src.modules.loader.loader import Loader
 
+logger = logging.getLogger(__name__)
 
 class CSVLoader(Loader):
     """
@@ -32,8 +35,9 @@ class CSVLoader(Loader):
         try:
             self.contract_path: str = config["loader"]["file_path"]
         except KeyError as e:
-            logging.error(f"Missing required configuration key: {e}")
-            raise KeyError(f"Missing required configuration key: {e}")
+            message = f"Missing required configuration key: {e}"
+            logger.error(message)
+            raise KeyError(message)
 
     def load_symbols(self) -> Dict[str, str]:
         """
@@ -48,45 +52,55 @@ class CSVLoader(Loader):
         """
         # Check if the CSV file exists
         if not os.path.exists(self.contract_path):
-            logging.error(f"Contract file not found at {self.contract_path}")
-            raise FileNotFoundError(f"Contract file not found at {self.contract_path}")
+            message = f"Contract file not found at {self.contract_path}"
+            logger.error(message)
+            raise FileNotFoundError(message)
 
-        # Read the CSV file
+        # Read the CSV file with Arrow's multi-threaded columnar parser
         try:
-            contracts_df: pd.DataFrame = pd.read_csv(self.contract_path)
-        except pd.errors.EmptyDataError:
-            logging.error(f"The CSV file at {self.contract_path} is empty or unreadable.")
-            raise ValueError(f"The CSV file at {self.contract_path} is empty or unreadable.")
-        except pd.errors.ParserError as e:
-            logging.error(f"Malformed CSV file at {self.contract_path}: {e}")
-            raise ValueError(f"Malformed CSV file at {self.contract_path}: {e}")
+            contracts_table: pa.Table = pacsv.read_csv(
+                self.contract_path,
+                read_options=pacsv.ReadOptions(use_threads=True),
+                convert_options=pacsv.ConvertOptions(
+                    column_types={column: pa.string() for column in self.REQUIRED_COLUMNS},
+                    strings_can_be_null=True,
+                ),
+            )
+        except pa.ArrowInvalid as e:
+            if "Empty CSV file" in str(e):
+                message = f"The CSV file at {self.contract_path} is empty or unreadable."
+            else:
+                message = f"Malformed CSV file at {self.contract_path}: {e}"
+            logger.error(message)
+            raise ValueError(message)
 
         # Validate required columns
-        missing_columns = [col for col in self.REQUIRED_COLUMNS if col not in contracts_df.columns]
+        missing_columns = [col for col in self.REQUIRED_COLUMNS if col not in contracts_table.column_names]
         if missing_columns:
-            logging.error(
-                f"CSV file must contain the following columns: {list(self.REQUIRED_COLUMNS.keys())}. "
-                f"Missing columns: {missing_columns}"
-            )
-            raise ValueError(
+            message = (
                 f"CSV file must contain the following columns: {list(self.REQUIRED_COLUMNS.keys())}. "
                 f"Missing columns: {missing_columns}"
             )
+            logger.error(message)
+            raise ValueError(message)
 
         # Ensure no duplicates or null values in 'dataSymbol'
-        if contracts_df["dataSymbol"].duplicated().any():
-            logging.error("Duplicate symbols found in 'dataSymbol' column.")
-            raise ValueError("Duplicate symbols found in 'dataSymbol' column.")
-        if contracts_df["dataSymbol"].isnull().any():
-            logging.error("Null values found in 'dataSymbol' column.")
-            raise ValueError("Null values found in 'dataSymbol' column.")
+        data_symbols: pa.ChunkedArray = contracts_table.column("dataSymbol")
+        if pc.count_distinct(data_symbols, mode="all").as_py() != len(data_symbols):
+            message = "Duplicate symbols found in 'dataSymbol' column."
+            logger.error(message)
+            raise ValueError(message)
+        if data_symbols.null_count:
+            message = "Null values found in 'dataSymbol' column."
+            logger.error(message)
+            raise ValueError(message)
 
         # Normalize data: Strip whitespace and ensure consistent casing
-        contracts_df["dataSymbol"] = contracts_df["dataSymbol"].str.strip()
-        contracts_df["instrumentType"] = contracts_df["instrumentType"].str.upper()
+        data_symbols = pc.utf8_trim_whitespace(data_symbols)
+        instrument_types: pa.ChunkedArray = pc.utf8_upper(contracts_table.column("instrumentType"))
 
         # Create a dictionary mapping symbols to their asset types
-        symbol_dict: Dict[str, str] = dict(zip(contracts_df["dataSymbol"], contracts_df["instrumentType"]))
+        symbol_dict: Dict[str, str] = dict(zip(data_symbols.to_pylist(), instrument_types.to_pylist()))
 
-        logging.info(f"Successfully loaded {len(symbol_dict)} symbols from {self.contract_path}.")
+        logger.info("Successfully loaded %d symbols from %s.", len(symbol_dict), self.contract_path)
         return symbol_dict
@@ -0,0 +1,59 @@
+from psycopg2 import sql
+from typing import IO, Any, Sequence
+
+
+def copy_skip_duplicates(
+    cursor: Any,
+    buffer: IO,
+    schema: str,
+    table: str,
+    columns: Sequence[str],
+    on_commit_drop: bool = False,
+) -> int:
+    """
+    Streams CSV rows into schema.table with a single COPY while keeping ON CONFLICT DO NOTHING
+    semantics: rows are copied into a temporary staging table first and then moved into the
+    target with INSERT ... SELECT, so duplicates are skipped instead of aborting the load.
+
+    The staging table is only dropped explicitly once the rows are merged. If the COPY or the
+    merge fails, the error propagates unchanged; statements run after a failure inside a
+    transaction would themselves fail and hide it. A leftover staging table from a failed
+    autocommit load is dropped at the start of the next call.
+
+    Args:
+        cursor (Any): An open psycopg2 cursor.
+        buffer (IO): Header-less CSV rows, positioned at the start, with one field per column.
+        schema (str): The target schema in TimescaleDB.
+        table (str): The target table in TimescaleDB.
+        columns (Sequence[str]): The CSV fields' column names, in order.
+        on_commit_drop (bool): Create the staging table with ON COMMIT DROP and leave dropping
+            it to the caller's commit or rollback. Only valid on a non-autocommit connection.
+
+    Returns:
+        int: The number of rows inserted; duplicates of existing rows are not counted.
+    """
+    target = sql.Identifier(schema, table)
+    staging = sql.Identifier(f"_staging_{table}")
+    column_names = sql.SQL(", ").join(map(sql.Identifier, columns))
+
+    drop_staging = sql.SQL("DROP TABLE IF EXISTS {}").format(staging)
+    create_staging = sql.SQL("CREATE TEMP TABLE {} (LIKE {} INCLUDING DEFAULTS)").format(staging, target)
+    if on_commit_drop:
+        create_staging += sql.SQL(" ON COMMIT DROP")
+
+    cursor.execute(drop_staging)
+    cursor.execute(create_staging)
+    cursor.copy_expert(
+        sql.SQL("COPY {} ({}) FROM STDIN WITH (FORMAT csv)").format(staging, column_names),
+        buffer,
+    )
+    cursor.execute(sql.SQL("""
+    INSERT INTO {target} ({columns})
+    SELECT {columns} FROM {staging}
+    ON CONFLICT DO NOTHING;
+    """).format(target=target, columns=column_names, staging=staging))
+    rows_inserted = cursor.rowcount
+
+    if not on_commit_drop:
+        cursor.execute(drop_staging)
+    return rows_inserted
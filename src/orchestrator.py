@@ -1,10 +1,12 @@
 import logging
 import asyncio
 import pandas as pd
+import pyarrow as pa
 from typing import Dict, Any, List, Optional
 from dotenv import load_dotenv
 from utils.dynamic_loader import get_instance, determine_date_range
 from src.modules.data_access import DataAccess
+from src.modules.inserter.timescaledb_inserter import DEFAULT_POOL_MAX_CONNECTIONS
 
 
 # Load environment variables
@@ -44,6 +46,21 @@ class Orchestrator:
         self.cleaner: Any = get_instance(self.config, "cleaner", "class")
         self.inserter: Any = get_instance(self.config, "inserter", "class")
 
+        # Inserters not currently used by a worker thread; each holds at most one connection
+        self._idle_inserters: List[Any] = [self.inserter]
+        self._store_semaphore: Optional[asyncio.Semaphore] = None
+
+    def _get_store_semaphore(self) -> asyncio.Semaphore:
+        """
+        Returns the semaphore bounding how many symbols are cleaned and inserted at once,
+        creating it on first use so it binds to the running event loop. The bound matches
+        database.pool_size so workers never outnumber the pooled connections.
+        """
+        if self._store_semaphore is None:
+            limit = int(self.config.get("database", {}).get("pool_size") or DEFAULT_POOL_MAX_CONNECTIONS)
+            self._store_semaphore = asyncio.Semaphore(limit)
+        return self._store_semaphore
+
     async def retrieve_and_process_data(self, symbol: Dict[str, str], start_date: str, end_date: str) -> None:
         """
         Fetch, clean, and insert data for a single symbol.
@@ -61,7 +78,10 @@ class Orchestrator:
                 unit = batch_config.get("unit")
                 max_units = batch_config.get("max_units")
 
-                logging.info(f"Fetching raw data via Batch Download with parameters: {symbol['dataSymbol']}, loaded_asset_type: {symbol['instrumentType']}, start: {start_date}, end: {end_date}, max_units: {max_units}")
+                logging.info(
+                    "Fetching raw data via Batch Download with parameters: %s, loaded_asset_type: %s, start: %s, end: %s, max_units: %s",
+                    symbol['dataSymbol'], symbol['instrumentType'], start_date, end_date, max_units,
+                )
                 raw_data: pd.DataFrame = await self.fetcher.generate_and_fetch_data(
                     symbol=symbol['dataSymbol'],
                     loaded_asset_type=symbol['instrumentType'],
@@ -73,7 +93,7 @@ class Orchestrator:
             
             elif not is_batch_enabled:
 
-                logging.info(f"Fetching raw data for symbol: {symbol['dataSymbol']}")
+                logging.info("Fetching raw data for symbol: %s", symbol['dataSymbol'])
                     
                     # Fetch raw data
                 raw_data: pd.DataFrame = await self.fetcher.fetch_data(
@@ -82,34 +102,67 @@ class Orchestrator:
                     start_date=start_date,
                     end_date=end_date,)
                
+            # Clean and insert on a worker thread so the event loop keeps driving other
+            # symbols' fetches; each worker uses its own inserter and pooled connection.
+            async with self._get_store_semaphore():
+                inserter = (
+                    self._idle_inserters.pop() if self._idle_inserters
+                    else get_instance(self.config, "inserter", "class")
+                )
+                try:
+                    await asyncio.to_thread(self.store_data, symbol, raw_data, inserter)
+                finally:
+                    self._idle_inserters.append(inserter)
+
+        except Exception as e:
+            logging.error("Failed to process symbol %s: %s", symbol['dataSymbol'], e)
+
+    def store_data(self, symbol: Dict[str, str], raw_data: pd.DataFrame, inserter: Any) -> None:
+        """
+        Insert raw data, clean it, and insert the cleaned data for a single symbol. Runs on a
+        worker thread.
+
+        Args:
+            symbol (Dict[str, str]): Metadata for the symbol.
+            raw_data (pd.DataFrame): The fetched data.
+            inserter (Any): Inserter used exclusively by this call.
+        """
+        try:
             # Connect to the database
-            self.inserter.connect()
+            inserter.connect()
         
             # Insert raw data
-            logging.info(f"Inserting raw data for symbol: {symbol['dataSymbol']}")
-            self.inserter.insert_data(
+            logging.info("Inserting raw data for symbol: %s", symbol['dataSymbol'])
+            inserter.insert_data(
                 data=raw_data.to_dict(orient="records"), 
                 schema=self.config["database"]["target_schema"], 
                 table=self.config["database"]["raw_table"]
             )
             
             # Clean data
-            logging.info(f"Cleaning data for symbol: {symbol['dataSymbol']}")
-            cleaned_data: List[Dict[str, Any]] = self.cleaner.clean(raw_data)
-
-            # Insert cleaned data
-            logging.info(f"Inserting data for symbol: {symbol['dataSymbol']}")
-            self.inserter.insert_data(
-                data=cleaned_data, 
-                schema=self.config["database"]["target_schema"], 
-                table=self.config["database"]["table"]
-            )
-
-        except Exception as e:
-            logging.error(f"Failed to process symbol {symbol['dataSymbol']}: {e}")
-
+            logging.info("Cleaning data for symbol: %s", symbol['dataSymbol'])
+            if hasattr(self.cleaner, "clean_as_table") and hasattr(inserter, "insert_arrow"):
+                # Columnar path: keep the cleaned data in Arrow and bulk COPY it
+                cleaned_table: pa.Table = self.cleaner.clean_as_table(raw_data)
+
+                logging.info("Inserting data for symbol: %s", symbol['dataSymbol'])
+                inserter.insert_arrow(
+                    data=cleaned_table,
+                    schema=self.config["database"]["target_schema"],
+                    table=self.config["database"]["table"]
+                )
+            else:
+                cleaned_data: List[Dict[str, Any]] = self.cleaner.clean(raw_data)
+
+                # Insert cleaned data
+                logging.info("Inserting data for symbol: %s", symbol['dataSymbol'])
+                inserter.insert_data(
+                    data=cleaned_data, 
+                    schema=self.config["database"]["target_schema"], 
+                    table=self.config["database"]["table"]
+                )
         finally:
-            self.inserter.close()
+            inserter.close()
 
     async def run(self) -> None:
         """
@@ -135,3 +188,8 @@ class Orchestrator:
         except Exception as e:
             logging.error(f"Pipeline execution failed: {e}")
             raise
+
+        finally:
+            # Release pooled HTTP connections held by fetchers that keep a session open
+            if asyncio.iscoroutinefunction(getattr(self.fetcher, "close", None)):
+                await self.fetcher.close()
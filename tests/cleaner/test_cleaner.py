@@ -1,5 +1,7 @@
 import unittest
+import numpy as np
 import pandas as pd
+import pyarrow as pa
 from typing import Dict, Any, Callable
 from src.modules.cleaner.databento_cleaner import DatabentoCleaner
 
@@ -78,6 +80,46 @@ class TestDatabentoCleaner(unittest.TestCase):
                     else:
                         self.assertEqual(expected_value, actual_value)
 
+    def test_handle_missing_data_keeps_categorical_symbol(self) -> None:
+        """
+        Test that filling and interpolation leave a dictionary-encoded symbol column intact.
+        """
+        data: pd.DataFrame = pd.DataFrame({
+            "open": [100.0, None, 102.0],
+            "volume": [1000, 1100, 1200],
+        })
+        data["symbol"] = pd.Series("MES.v.0", index=data.index, dtype="category")
+
+        for method in ("interpolate", "zero_fill", "custom_fill"):
+            with self.subTest(method=method):
+                self.config["missing_data"] = {method: "True", "custom_value": 999}
+                cleaner: DatabentoCleaner = DatabentoCleaner(config=self.config)
+                result: pd.DataFrame = cleaner.handle_missing_data(data.copy())
+
+                self.assertFalse(result["open"].isna().any())
+                self.assertIsInstance(result["symbol"].dtype, pd.CategoricalDtype)
+                self.assertListEqual(list(result.columns), ["open", "volume", "symbol"])
+
+    def test_mean_fill_covers_narrow_numeric_dtypes(self) -> None:
+        """
+        Test that mean and median fills apply to float32 columns, not only float64/int64.
+        """
+        data: pd.DataFrame = pd.DataFrame({"open": pd.Series([1.0, None, 3.0], dtype="float32")})
+
+        for method in ("mean_fill", "median_fill"):
+            with self.subTest(method=method):
+                self.config["missing_data"] = {method: "True"}
+                result: pd.DataFrame = DatabentoCleaner(config=self.config).handle_missing_data(data.copy())
+                self.assertEqual(result["open"].iloc[1], 2.0)
+
+    def test_missing_data_flags_are_normalized(self) -> None:
+        """
+        Test that boolean and differently-cased string flags enable methods the same way.
+        """
+        self.config["missing_data"] = {"zero_fill": True, "drop_nan": " true ", "mean_fill": "False"}
+        cleaner: DatabentoCleaner = DatabentoCleaner(config=self.config)
+        self.assertEqual(cleaner._enabled_methods, ("drop_nan", "zero_fill"))
+
     def test_clean_with_invalid_fields(self) -> None:
         """
         Test that the clean method raises an exception for missing fields.
@@ -92,6 +134,151 @@ class TestDatabentoCleaner(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.cleaner.clean(data)
 
+    def test_transform_data_compact_dtypes(self) -> None:
+        """
+        Test that compact_dtypes downcasts prices to float32 and volume to the narrowest int.
+        """
+        self.config["cleaner"] = {"compact_dtypes": True}
+        cleaner: DatabentoCleaner = DatabentoCleaner(config=self.config)
+        data: pd.DataFrame = pd.DataFrame({
+            "time": ["2023-01-01", "2023-01-02"],
+            "symbol": ["ESH3", "ESH3"],
+            "open": [100.0, 101.0],
+            "high": [101.0, 102.0],
+            "low": [99.0, 100.0],
+            "close": [100.5, 101.5],
+            "volume": [1000, 70000],
+        })
+
+        result: pd.DataFrame = cleaner.transform_data(data)
+
+        for column in ["open", "high", "low", "close"]:
+            self.assertEqual(result[column].dtype, "float32")
+        self.assertEqual(result["volume"].dtype, "int32")
+        self.assertEqual(result["close"].tolist(), [100.5, 101.5])
+
+    def test_compact_dtypes_preserve_back_adjusted_prices(self) -> None:
+        """
+        Test that compacting after back-adjustment keeps adjusted prices within float32 epsilon
+        of the full-precision result on a series that rolls repeatedly.
+        """
+        data: pd.DataFrame = pd.DataFrame({
+            "time": pd.date_range("2023-01-01", periods=8, freq="D").strftime("%Y-%m-%d"),
+            "symbol": ["ESH3", "ESH3", "ESM3", "ESM3", "ESU3", "ESU3", "ESZ3", "ESZ3"],
+            "open": [4100.1, 4100.3, 4133.7, 4131.9, 4167.3, 4160.1, 4201.7, 4199.9],
+            "high": [4101.1, 4102.3, 4135.7, 4133.9, 4169.3, 4162.1, 4203.7, 4201.9],
+            "low": [4099.1, 4099.3, 4131.7, 4130.9, 4165.3, 4158.1, 4199.7, 4197.9],
+            "close": [4100.7, 4100.9, 4131.3, 4133.1, 4162.9, 4161.3, 4200.1, 4201.3],
+            "volume": [1000, 900, 2000, 1500, 3000, 2500, 4000, 3500],
+        })
+        self.config["cleaner"] = {"compact_dtypes": True}
+        compacted: pd.DataFrame = DatabentoCleaner(config=self.config).transform_data(data.copy())
+        full: pd.DataFrame = self.cleaner.transform_data(data.copy())
+
+        epsilon: float = float(np.finfo(np.float32).eps)
+        for column in ["open", "high", "low", "close"]:
+            self.assertEqual(compacted[column].dtype, "float32")
+            self.assertEqual(full[column].dtype, "float64")
+            np.testing.assert_allclose(
+                compacted[column].to_numpy(dtype=np.float64), full[column].to_numpy(), rtol=epsilon, atol=0
+            )
+
+    def test_transform_data_time_inputs(self) -> None:
+        """
+        Test that ISO strings and epoch nanoseconds normalize to the same UTC timestamps.
+        """
+        prices: Dict[str, Any] = {
+            "symbol": ["ESH3", "ESH3"],
+            "open": [100.0, 101.0],
+            "high": [101.0, 102.0],
+            "low": [99.0, 100.0],
+            "close": [100.5, 101.5],
+            "volume": [1000, 1200],
+        }
+        from_strings: pd.DataFrame = self.cleaner.transform_data(
+            pd.DataFrame({"time": ["2023-01-01T00:00:00Z", "2023-01-02"], **prices})
+        )
+        from_epoch: pd.DataFrame = self.cleaner.transform_data(
+            pd.DataFrame({"time": [1672531200000000000, 1672617600000000000], **prices})
+        )
+
+        expected = pd.to_datetime(["2023-01-01", "2023-01-02"], utc=True)
+        self.assertEqual(from_strings["time"].tolist(), expected.tolist())
+        self.assertEqual(from_epoch["time"].tolist(), expected.tolist())
+
+    def test_apply_back_adjustment(self) -> None:
+        """
+        Test that each roll shifts all earlier rows by the previous close minus the new open.
+        """
+        data: pd.DataFrame = pd.DataFrame({
+            "symbol": ["ESH3", "ESH3", "ESM3", "ESM3", "ESU3"],
+            "open": [100.0, 101.0, 105.0, 106.0, 110.0],
+            "high": [101.0, 102.0, 106.0, 107.0, 111.0],
+            "low": [99.0, 100.0, 104.0, 105.0, 109.0],
+            "close": [100.5, 102.0, 105.5, 108.0, 110.5],
+            "volume": [1000, 900, 2000, 1500, 3000],
+        })
+
+        result: pd.DataFrame = self.cleaner.apply_back_adjustment(data)
+
+        # Rolls at row 2 (102.0 - 105.0 = -3.0) and row 4 (108.0 - 110.0 = -2.0)
+        self.assertEqual(result["open"].tolist(), [95.0, 96.0, 103.0, 104.0, 110.0])
+        self.assertEqual(result["close"].tolist(), [95.5, 97.0, 103.5, 106.0, 110.5])
+
+    def test_detect_time_gaps(self) -> None:
+        """
+        Test that gaps are found in unsorted data with duplicate timestamps.
+        """
+        data: pd.DataFrame = pd.DataFrame({
+            "time": pd.to_datetime(["2023-01-05", "2023-01-02", "2023-01-03", "2023-01-03"], utc=True),
+        })
+
+        missing = self.cleaner.detect_time_gaps(data, time_column="time", freq="B")
+
+        self.assertListEqual(list(missing), [pd.Timestamp("2023-01-04", tz="UTC")])
+
+    def test_clean_matches_clean_as_frame(self) -> None:
+        """
+        Test that clean returns one dictionary per row of the cleaned DataFrame.
+        """
+        data: pd.DataFrame = pd.DataFrame({
+            "ts_event": pd.to_datetime(["2023-01-01", "2023-01-02"]),
+            "symbol": ["ESH3", "ESH3"],
+            "open": [100.0, 101.0],
+            "high": [101.0, 102.0],
+            "low": [99.0, 100.0],
+            "close": [100.5, 101.5],
+            "volume": [1000, 1200],
+            "rtype": [35, 35],
+        })
+
+        frame: pd.DataFrame = self.cleaner.clean_as_frame(data.copy())
+        records = self.cleaner.clean(data.copy())
+
+        self.assertIsInstance(frame, pd.DataFrame)
+        self.assertEqual(records, frame.to_dict(orient="records"))
+        self.assertNotIn("rtype", records[0])
+
+    def test_clean_as_table(self) -> None:
+        """
+        Test that clean_as_table returns the cleaned DataFrame as an Arrow table.
+        """
+        data: pd.DataFrame = pd.DataFrame({
+            "ts_event": pd.to_datetime(["2023-01-01", "2023-01-02"]),
+            "symbol": ["ESH3", "ESH3"],
+            "open": [100.0, 101.0],
+            "high": [101.0, 102.0],
+            "low": [99.0, 100.0],
+            "close": [100.5, 101.5],
+            "volume": [1000, 1200],
+        })
+
+        table: pa.Table = self.cleaner.clean_as_table(data.copy())
+
+        self.assertIsInstance(table, pa.Table)
+        self.assertEqual(table.column_names, ["time", "symbol", "open", "high", "low", "close", "volume"])
+        pd.testing.assert_frame_equal(table.to_pandas(), self.cleaner.clean_as_frame(data.copy()))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -79,6 +79,23 @@ class TestTiingoCleaner(unittest.TestCase):
         # the -5.0 close row must not survive
         self.assertTrue(all(r["close"] > 0 for r in result))
 
+    def test_missing_data_flags_accept_booleans(self) -> None:
+        raw = self._raw()
+        raw.loc[1, "div_cash"] = None
+        config = {"missing_data": {"zero_fill": True, "drop_nan": False}}
+        result = TiingoCleaner(config=config).clean(raw)
+        # zero_fill enabled by a YAML boolean fills the gap instead of dropping the row
+        self.assertEqual(len(result), 2)
+        self.assertEqual(result[1]["div_cash"], 0.0)
+
+    def test_mean_fill_uses_column_means(self) -> None:
+        raw = self._raw()
+        raw.loc[1, "div_cash"] = None
+        config = {"missing_data": {"mean_fill": "True"}}
+        data = TiingoCleaner(config=config).handle_missing_data(raw.drop(columns=["junk_extra"]))
+        self.assertAlmostEqual(data.loc[1, "div_cash"], 0.0)
+        self.assertFalse(data[["div_cash"]].isna().any().any())
+
     def test_missing_required_field_raises(self) -> None:
         bad = self._raw().drop(columns=["adjusted_close"])
         with self.assertRaises(ValueError):
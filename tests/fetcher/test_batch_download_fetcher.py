@@ -0,0 +1,195 @@
+import asyncio
+import unittest
+from unittest.mock import patch
+from typing import Any, Dict, List, Tuple
+import pandas as pd
+from src.modules.fetcher.batch_download_databento_fetcher import BatchDownloadDatabentoFetcher
+from src.modules.fetcher.databento_fetcher import get_client
+
+
+def loop_batches(start_date: str, end_date: str, unit: str, max_units_allowed: int) -> List[List[str]]:
+    """
+    Reference implementation: the original one-Timestamp-at-a-time batch loop.
+    """
+    time_unit, date_format = {
+        "daily": ("D", "%Y-%m-%d"),
+        "hourly": ("H", "%Y-%m-%d %H:%M:%S"),
+        "min": ("min", "%Y-%m-%d %H:%M:%S"),
+    }[unit]
+    delta = pd.Timedelta(max_units_allowed, unit=time_unit)
+    end_ts = pd.Timestamp(end_date)
+    batches: List[List[str]] = []
+    current_ts = pd.Timestamp(start_date)
+    while current_ts < end_ts:
+        batch_end = min(current_ts + delta, end_ts)
+        batches.append([current_ts.strftime(date_format), batch_end.strftime(date_format)])
+        current_ts = batch_end
+    return batches
+
+
+class TestBatchDownloadDatabentoFetcher(unittest.IsolatedAsyncioTestCase):
+    """
+    Unit tests for BatchDownloadDatabentoFetcher with the per-batch request stubbed out.
+    """
+
+    def setUp(self) -> None:
+        """
+        Build a fetcher around a patched Databento client.
+        """
+        get_client.cache_clear()
+        self.addCleanup(get_client.cache_clear)
+        historical = patch("src.modules.fetcher.databento_fetcher.db.Historical")
+        historical.start()
+        self.addCleanup(historical.stop)
+
+        self.config: Dict[str, Any] = {
+            "provider": {
+                "asset": "FUTURE",
+                "dataset": "GLBX.MDP3",
+                "schema": "ohlcv-1d",
+                "roll_type": "v",
+                "contract_type": "0",
+                "pool_size": 2,
+            },
+        }
+        self.fetcher: BatchDownloadDatabentoFetcher = BatchDownloadDatabentoFetcher(config=self.config)
+
+    def _stub_fetch(self, frames: Dict[str, pd.DataFrame], delays: Dict[str, float]) -> List[str]:
+        """
+        Replace fetch_data with a coroutine returning frames[start_date] after delays[start_date].
+
+        Returns:
+            List[str]: Batch start dates, appended as each fetch completes.
+        """
+        completed: List[str] = []
+
+        async def fake_fetch(symbol: str, loaded_asset_type: str, start_date: str, end_date: str) -> pd.DataFrame:
+            await asyncio.sleep(delays.get(start_date, 0))
+            completed.append(start_date)
+            return frames[start_date]
+
+        self.fetcher.fetch_data = fake_fetch
+        return completed
+
+    @staticmethod
+    def _frame(day: str, close: float) -> pd.DataFrame:
+        """
+        Build a one-row OHLCV frame for a day.
+        """
+        return pd.DataFrame({
+            "time": [pd.Timestamp(day, tz="UTC")],
+            "open": [close], "high": [close], "low": [close], "close": [close],
+            "volume": [100], "symbol": ["MES.v.0"],
+        })
+
+    async def test_results_are_chronological_regardless_of_completion_order(self) -> None:
+        """
+        Test that batches finishing out of order are still concatenated oldest first.
+        """
+        frames = {
+            "2023-01-01": self._frame("2023-01-01", 1.0),
+            "2023-01-03": self._frame("2023-01-03", 2.0),
+            "2023-01-05": self._frame("2023-01-05", 3.0),
+        }
+        # The earliest batch finishes last
+        completed = self._stub_fetch(frames, {"2023-01-01": 0.03, "2023-01-03": 0.02, "2023-01-05": 0.01})
+        self.fetcher.pool_size = 3
+
+        result: pd.DataFrame = await self.fetcher.generate_and_fetch_data(
+            "ES", "FUTURE", "2023-01-01", "2023-01-07", unit="daily", max_units_allowed=2
+        )
+
+        self.assertEqual(completed, ["2023-01-05", "2023-01-03", "2023-01-01"])
+        self.assertEqual(result["close"].tolist(), [1.0, 2.0, 3.0])
+        self.assertEqual(result.index.tolist(), [0, 1, 2])
+
+    async def test_concurrent_batches_are_bounded_by_pool_size(self) -> None:
+        """
+        Test that batches overlap but never more than pool_size run at once, and that the
+        result keeps batch order.
+        """
+        starts: List[str] = ["2023-01-01", "2023-01-02", "2023-01-03", "2023-01-04", "2023-01-05"]
+        in_flight: List[int] = [0]
+        peak: List[int] = [0]
+
+        async def fake_fetch(symbol: str, loaded_asset_type: str, start_date: str, end_date: str) -> pd.DataFrame:
+            in_flight[0] += 1
+            peak[0] = max(peak[0], in_flight[0])
+            await asyncio.sleep(0.01)
+            in_flight[0] -= 1
+            return self._frame(start_date, float(starts.index(start_date)))
+
+        self.fetcher.fetch_data = fake_fetch
+
+        result: pd.DataFrame = await self.fetcher.generate_and_fetch_data(
+            "ES", "FUTURE", "2023-01-01", "2023-01-06", unit="daily", max_units_allowed=1
+        )
+
+        self.assertEqual(peak[0], self.config["provider"]["pool_size"])
+        self.assertEqual(result["close"].tolist(), [0.0, 1.0, 2.0, 3.0, 4.0])
+
+    async def test_all_empty_batches_keep_ohlcv_columns(self) -> None:
+        """
+        Test that an all-empty download returns an empty frame with the OHLCV columns.
+        """
+        columns: List[str] = ["time", "open", "high", "low", "close", "volume", "symbol"]
+        empty = pd.DataFrame(columns=columns)
+        self._stub_fetch({"2023-01-01": empty, "2023-01-03": empty}, {})
+
+        result: pd.DataFrame = await self.fetcher.generate_and_fetch_data(
+            "ES", "FUTURE", "2023-01-01", "2023-01-05", unit="daily", max_units_allowed=2
+        )
+
+        self.assertTrue(result.empty)
+        self.assertListEqual(list(result.columns), columns)
+
+    async def test_empty_batches_are_skipped(self) -> None:
+        """
+        Test that empty batches in the middle of a range do not affect the result.
+        """
+        frames = {
+            "2023-01-01": self._frame("2023-01-01", 1.0),
+            "2023-01-03": pd.DataFrame(columns=["time", "open", "high", "low", "close", "volume", "symbol"]),
+            "2023-01-05": self._frame("2023-01-05", 3.0),
+        }
+        self._stub_fetch(frames, {})
+
+        result: pd.DataFrame = await self.fetcher.generate_and_fetch_data(
+            "ES", "FUTURE", "2023-01-01", "2023-01-07", unit="daily", max_units_allowed=2
+        )
+
+        self.assertEqual(result["close"].tolist(), [1.0, 3.0])
+
+    def test_generate_batches_matches_loop(self) -> None:
+        """
+        Test that the vectorized batches equal the original loop's at the range boundaries.
+        """
+        cases: Dict[str, Tuple[str, str, str, int]] = {
+            "shorter than one batch": ("2023-01-01", "2023-01-03", "daily", 5),
+            "exact multiple": ("2023-01-01", "2023-01-07", "daily", 2),
+            "final partial batch": ("2023-01-01", "2023-01-08", "daily", 3),
+            "single unit batches": ("2023-01-01", "2023-01-04", "daily", 1),
+            "empty range": ("2023-01-01", "2023-01-01", "daily", 2),
+            "end before start": ("2023-01-05", "2023-01-01", "daily", 2),
+            "hourly partial": ("2023-01-01 00:00:00", "2023-01-01 05:00:00", "hourly", 2),
+            "minute partial": ("2023-01-01 00:00:00", "2023-01-01 00:07:00", "min", 3),
+        }
+        for name, (start, end, unit, max_units) in cases.items():
+            with self.subTest(case=name):
+                self.assertEqual(
+                    self.fetcher.generate_batches(start, end, unit, max_units),
+                    loop_batches(start, end, unit, max_units),
+                )
+
+    def test_generate_batches_final_partial(self) -> None:
+        """
+        Test that the last batch is clipped to the end date.
+        """
+        self.assertEqual(
+            self.fetcher.generate_batches("2023-01-01", "2023-01-08", "daily", 3),
+            [["2023-01-01", "2023-01-04"], ["2023-01-04", "2023-01-07"], ["2023-01-07", "2023-01-08"]],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
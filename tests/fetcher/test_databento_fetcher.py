@@ -1,9 +1,10 @@
+import asyncio
 import unittest
 from unittest.mock import patch, MagicMock, AsyncMock
 from typing import List, Dict, Any
 import pandas as pd
 import databento as db
-from src.modules.fetcher.databento_fetcher import DatabentoFetcher
+from src.modules.fetcher.databento_fetcher import DatabentoFetcher, get_client
 
 class TestDatabentoFetcher(unittest.IsolatedAsyncioTestCase):
     def setUp(self) -> None:
@@ -27,6 +28,9 @@ class TestDatabentoFetcher(unittest.IsolatedAsyncioTestCase):
         self.mock_schema = MagicMock()
         self.mock_stype = MagicMock()
         
+        # Drop any client shared from a previous test so the patched Historical is used
+        get_client.cache_clear()
+
         # Create patches
         self.patches = [
             patch("data.modules.databento_fetcher.db.Historical"),
@@ -121,4 +125,63 @@ class TestDatabentoFetcher(unittest.IsolatedAsyncioTestCase):
         # Should return empty DataFrame with expected columns
         expected_columns = ["time", "open", "high", "low", "close", "volume", "symbol"]
         self.assertTrue(result.empty)
-        self.assertListEqual(list(result.columns), expected_columns)
\ No newline at end of file
+        self.assertListEqual(list(result.columns), expected_columns)
+
+
+class TestDatabentoFetcherFetchMany(unittest.IsolatedAsyncioTestCase):
+    """
+    Unit tests for DatabentoFetcher.fetch_many with fetch_data stubbed out.
+    """
+
+    def setUp(self) -> None:
+        """
+        Build a fetcher with pool_size=2 around a patched Databento client.
+        """
+        get_client.cache_clear()
+        self.addCleanup(get_client.cache_clear)
+        historical = patch("src.modules.fetcher.databento_fetcher.db.Historical")
+        historical.start()
+        self.addCleanup(historical.stop)
+        self.fetcher = DatabentoFetcher(config={"provider": {"asset": "FUTURE", "pool_size": 2}})
+
+    async def test_fetch_many_bounds_concurrency(self) -> None:
+        """
+        Test that no more than pool_size requests are in flight and results keep input order.
+        """
+        in_flight: List[int] = [0]
+        peak: List[int] = [0]
+
+        async def fake_fetch(symbol: str, loaded_asset_type: str, start_date: str, end_date: str) -> pd.DataFrame:
+            in_flight[0] += 1
+            peak[0] = max(peak[0], in_flight[0])
+            await asyncio.sleep(0.01)
+            in_flight[0] -= 1
+            return pd.DataFrame({"symbol": [symbol]})
+
+        self.fetcher.fetch_data = fake_fetch
+        symbols: List[str] = ["ES", "NQ", "RTY", "YM", "CL"]
+
+        results = await self.fetcher.fetch_many(symbols, "FUTURE", "2023-01-01", "2023-01-02")
+
+        self.assertEqual(peak[0], 2)
+        self.assertEqual([result["symbol"].iloc[0] for result in results], symbols)
+
+    async def test_fetch_many_returns_exceptions_in_place(self) -> None:
+        """
+        Test that a failed symbol yields its exception without cancelling the others.
+        """
+        async def fake_fetch(symbol: str, loaded_asset_type: str, start_date: str, end_date: str) -> pd.DataFrame:
+            if symbol == "NQ":
+                raise ValueError("bad symbol")
+            await asyncio.sleep(0.01)
+            return pd.DataFrame({"symbol": [symbol]})
+
+        self.fetcher.fetch_data = fake_fetch
+
+        with self.assertLogs("DatabentoFetcher", level="WARNING") as logs:
+            results = await self.fetcher.fetch_many(["ES", "NQ", "RTY"], "FUTURE", "2023-01-01", "2023-01-02")
+
+        self.assertIsInstance(results[1], ValueError)
+        self.assertEqual(results[0]["symbol"].iloc[0], "ES")
+        self.assertEqual(results[2]["symbol"].iloc[0], "RTY")
+        self.assertIn("Failed to fetch 1 of 3 symbols: ['NQ']", logs.output[0])
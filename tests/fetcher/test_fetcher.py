@@ -62,6 +62,25 @@ class TestFetcher(unittest.TestCase):
         self.assertIn("FUTURES", supported_assets, "FUTURES should be a supported asset.")
         self.assertNotIn("OPTIONS", supported_assets, "OPTIONS should not be supported.")
 
+    def test_detect_time_gaps(self) -> None:
+        """
+        Test that gaps are found in unsorted data and reported as strings.
+        """
+        data: List[Dict[str, Any]] = [
+            {"time": "2023-01-03", "open": 101.0},
+            {"time": "2023-01-01", "open": 100.0},
+            {"time": "2023-01-05", "open": 102.0},
+        ]
+        missing: List[str] = self.fetcher.detect_time_gaps(data, time_column="time", freq="D")
+        self.assertListEqual(missing, ["2023-01-02", "2023-01-04"])
+
+    def test_detect_time_gaps_missing_column(self) -> None:
+        """
+        Test that a missing time column raises a ValueError.
+        """
+        with self.assertRaises(ValueError):
+            self.fetcher.detect_time_gaps([{"open": 100.0}], time_column="time", freq="D")
+
     def test_invalid_initialization(self) -> None:
         """
         Test that initializing without a config raises an error.
@@ -19,7 +19,7 @@ class _FakeResponse:
     async def __aexit__(self, *exc):
         return False
 
-    async def json(self):
+    async def json(self, loads=None):
         return self._payload
 
     async def text(self):
@@ -31,6 +31,10 @@ class _FakeSession:
         self._response = response
         self.last_url = None
         self.last_params = None
+        self.closed = False
+
+    async def close(self):
+        self.closed = True
 
     async def __aenter__(self):
         return self
@@ -104,6 +108,18 @@ class TestTiingoFetcher(unittest.IsolatedAsyncioTestCase):
             with self.assertRaises(RuntimeError):
                 await fetcher.fetch_data("BADSYM", "EQUITY", "2024-01-02", "2024-01-03")
 
+    async def test_session_reused_across_fetches(self) -> None:
+        """One pooled session serves every request and is closed on exit."""
+        session = _FakeSession(_FakeResponse(200, _sample_payload()))
+        with patch("src.modules.fetcher.tiingo_fetcher.aiohttp.ClientSession", return_value=session) as factory:
+            async with TiingoFetcher(config=self.config) as fetcher:
+                await fetcher.fetch_data("AAPL", "EQUITY", "2024-01-02", "2024-01-03")
+                await fetcher.fetch_data("MSFT", "EQUITY", "2024-01-02", "2024-01-03")
+
+        factory.assert_called_once()
+        self.assertTrue(session.closed)
+        self.assertIsNone(fetcher._session)
+
     def test_missing_api_key_raises(self) -> None:
         """Constructing without TIINGO_API_KEY raises EnvironmentError."""
         with patch.dict(os.environ, {"TIINGO_API_KEY": ""}, clear=True):
@@ -118,6 +134,7 @@ class _RoutingSession:
     def __init__(self, by_token):
         self._by_token = by_token
         self.tokens_tried = []
+        self.closed = False
 
     async def __aenter__(self):
         return self
@@ -270,7 +287,7 @@ class _ConcurrencyResponse:
         self._state["cur"] -= 1
         return False
 
-    async def json(self):
+    async def json(self, loads=None):
         return self._payload
 
     async def text(self):
@@ -281,6 +298,7 @@ class _ConcurrencySession:
     def __init__(self, state, payload):
         self._state = state
         self._payload = payload
+        self.closed = False
 
     async def __aenter__(self):
         return self
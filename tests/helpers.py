@@ -0,0 +1,18 @@
+from typing import Any
+from psycopg2 import sql
+
+
+def render(query: Any) -> str:
+    """
+    Render a query passed to a mocked cursor as text, double-quoting psycopg2.sql identifiers
+    the way a real connection would for plain lowercase names.
+    """
+    if isinstance(query, sql.Composed):
+        return "".join(render(part) for part in query.seq)
+    if isinstance(query, sql.Identifier):
+        return ".".join(f'"{name}"' for name in query.strings)
+    if isinstance(query, sql.Placeholder):
+        return "%s"
+    if isinstance(query, sql.SQL):
+        return query.string
+    return query
@@ -1,6 +1,9 @@
 import unittest
 from unittest.mock import patch, MagicMock
-from src.modules.inserter.timescaledb_inserter import TimescaleDBInserter
+import psycopg2
+import pyarrow as pa
+from src.modules.inserter.timescaledb_inserter import TimescaleDBInserter, get_pool
+from tests.helpers import render
 from typing import List, Dict, Any
 import re
 
@@ -21,23 +24,54 @@ class TestTimescaleDBInserter(unittest.TestCase):
             }
         }
         self.inserter = TimescaleDBInserter(config=self.config)
+        get_pool.cache_clear()
+        self.addCleanup(get_pool.cache_clear)
 
-    @patch("data.modules.timescaledb_inserter.psycopg2.connect")
-    def test_connect(self, mock_connect: MagicMock) -> None:
+    def _configure_pool(self, mock_pool_class: MagicMock) -> MagicMock:
+        """
+        Make the mocked pool's connections answer the endpoint diagnostics run on pool creation.
+        """
+        mock_pool = mock_pool_class.return_value
+        mock_cursor = mock_pool.getconn.return_value.cursor.return_value.__enter__.return_value
+        mock_cursor.fetchone.return_value = ("127.0.0.1", 5432, "algo_data", "postgres")
+        mock_cursor.fetchall.return_value = [("futures_data",)]
+        return mock_pool
+
+    @patch("src.modules.inserter.timescaledb_inserter.ThreadedConnectionPool")
+    def test_connect(self, mock_pool_class: MagicMock) -> None:
         """
-        Test that the connect method establishes a database connection.
+        Test that the connect method checks out a connection from the shared pool.
         """
+        self._configure_pool(mock_pool_class)
         self.inserter.connect()
-        mock_connect.assert_called_once()
-        self.assertIsNotNone(self.inserter.connection, "Database connection should not be None")
+        mock_pool_class.assert_called_once()
+        self.assertIs(self.inserter.connection, mock_pool_class.return_value.getconn.return_value)
+        self.assertTrue(self.inserter.connection.autocommit)
 
-    @patch("data.modules.timescaledb_inserter.psycopg2.connect")
-    def test_insert_data(self, mock_connect: MagicMock) -> None:
+    @patch("src.modules.inserter.timescaledb_inserter.ThreadedConnectionPool")
+    def test_connect_reuses_pool(self, mock_pool_class: MagicMock) -> None:
         """
-        Test that data is inserted into the database using executemany.
+        Test that repeated connect/close cycles and other inserters share one pool.
         """
-        mock_connection = mock_connect.return_value
-        mock_cursor = mock_connection.cursor.return_value.__enter__.return_value
+        mock_pool = self._configure_pool(mock_pool_class)
+        other = TimescaleDBInserter(config=self.config)
+        for inserter in (self.inserter, self.inserter, other):
+            inserter.connect()
+            inserter.connect()  # no-op while a connection is held
+            inserter.close()
+
+        mock_pool_class.assert_called_once()
+        # One checkout for the endpoint diagnostics, then one per connect/close cycle
+        self.assertEqual(mock_pool.getconn.call_count, 4)
+
+    @patch("src.modules.inserter.timescaledb_inserter.execute_values")
+    def test_insert_data(self, mock_execute_values: MagicMock) -> None:
+        """
+        Test that data is inserted with multi-row statements via execute_values, one tuple per row.
+        """
+        self.inserter.connection = MagicMock()
+        mock_cursor = self.inserter.connection.cursor.return_value.__enter__.return_value
+        mock_cursor.fetchone.return_value = (1,)
 
         data: List[Dict[str, Any]] = [
             {
@@ -51,22 +85,55 @@ class TestTimescaleDBInserter(unittest.TestCase):
             }
         ]
 
-        self.inserter.connect()
         self.inserter.insert_data(data, schema="futures_data", table="ohlcv_1d")
 
         # Compare queries without extra whitespace
-        expected_query = re.sub(r"\s+", " ", """
-            INSERT INTO futures_data.ohlcv_1d (time, symbol, open, high, low, close, volume)
-            VALUES (%(time)s, %(symbol)s, %(open)s, %(high)s, %(low)s, %(close)s, %(volume)s)
-            ON CONFLICT DO NOTHING;
-        """).strip()
+        columns = '"time", "symbol", "open", "high", "low", "close", "volume"'
+        expected_query = f'INSERT INTO "futures_data"."ohlcv_1d" ({columns}) VALUES %s ON CONFLICT DO NOTHING;'
+
+        cursor, actual_query, actual_rows = mock_execute_values.call_args[0]
+        self.assertIs(cursor, mock_cursor)
+        self.assertEqual(re.sub(r"\s+", " ", render(actual_query)).strip(), expected_query)
+        self.assertEqual(actual_rows, [("2023-01-01 00:00:00", "ES", 100.5, 101.0, 99.5, 100.0, 1500)])
+        self.assertEqual(mock_execute_values.call_args[1]["page_size"], 1000)
+        mock_cursor.executemany.assert_not_called()
+
+    @patch("src.modules.inserter.timescaledb_inserter.execute_values")
+    def test_insert_data_single_column(self, mock_execute_values: MagicMock) -> None:
+        """
+        Test that a single-column insert still sends one tuple per row.
+        """
+        self.inserter.connection = MagicMock()
+        mock_cursor = self.inserter.connection.cursor.return_value.__enter__.return_value
+        mock_cursor.fetchone.return_value = (1,)
+
+        self.inserter.insert_data([{"time": "2023-01-01"}, {"time": "2023-01-02"}], schema="futures_data", table="ohlcv_1d")
 
-        # Extract the actual query from the call arguments
-        actual_query, actual_data = mock_cursor.executemany.call_args[0]
+        self.assertEqual(mock_execute_values.call_args[0][2], [("2023-01-01",), ("2023-01-02",)])
 
-        # Assert that the queries are equivalent
-        self.assertEqual(re.sub(r"\s+", " ", actual_query.strip()), expected_query)
-        self.assertEqual(actual_data, data)
+    @patch("src.modules.inserter.timescaledb_inserter.execute_values")
+    def test_insert_data_verifies_target_once(self, mock_execute_values: MagicMock) -> None:
+        """
+        Test that the catalog checks run on the first insert into a target only, and run again
+        after a failed insert.
+        """
+        self.inserter.connection = MagicMock()
+        mock_cursor = self.inserter.connection.cursor.return_value.__enter__.return_value
+        mock_cursor.fetchone.return_value = (1,)
+        data: List[Dict[str, Any]] = [{"time": "2023-01-01", "close": 1.0}]
+
+        for _ in range(3):
+            self.inserter.insert_data(data, schema="futures_data", table="ohlcv_1d")
+        # One schema and one table lookup in total
+        self.assertEqual(mock_cursor.execute.call_count, 2)
+        self.assertEqual(mock_execute_values.call_count, 3)
+
+        mock_execute_values.side_effect = psycopg2.errors.UndefinedTable("relation does not exist")
+        with self.assertRaises(RuntimeError):
+            self.inserter.insert_data(data, schema="futures_data", table="ohlcv_1d")
+        mock_execute_values.side_effect = None
+        self.inserter.insert_data(data, schema="futures_data", table="ohlcv_1d")
+        self.assertEqual(mock_cursor.execute.call_count, 4)
 
     @patch("data.modules.timescaledb_inserter.psycopg2.connect")
     def test_insert_data_empty(self, mock_connect: MagicMock) -> None:
@@ -85,16 +152,63 @@ class TestTimescaleDBInserter(unittest.TestCase):
         with self.assertRaises(RuntimeError, msg="Database connection is not established."):
             self.inserter.insert_data([{"time": "2023-01-01"}], schema="futures_data", table="ohlcv_1d")
 
-    @patch("data.modules.timescaledb_inserter.psycopg2.connect")
-    def test_close_connection(self, mock_connect: MagicMock) -> None:
+    def test_insert_arrow(self) -> None:
+        """
+        Test that insert_arrow stages rows with COPY and merges them with ON CONFLICT DO NOTHING.
+        """
+        mock_connection = MagicMock()
+        mock_cursor = mock_connection.cursor.return_value.__enter__.return_value
+        mock_cursor.fetchone.return_value = (1,)
+        self.inserter.connection = mock_connection
+
+        data = pa.table({
+            "time": ["2023-01-01 00:00:00"],
+            "symbol": ["ES"],
+            "open": [100.5],
+            "high": [101.0],
+            "low": [99.5],
+            "close": [100.0],
+            "volume": [1500],
+        })
+        self.inserter.insert_arrow(data, schema="futures_data", table="ohlcv_1d")
+
+        copy_sql, buffer = mock_cursor.copy_expert.call_args[0]
+        self.assertIn(
+            'COPY "_staging_ohlcv_1d" ("time", "symbol", "open", "high", "low", "close", "volume") FROM STDIN',
+            render(copy_sql),
+        )
+        self.assertEqual(buffer.getvalue(), b'"2023-01-01 00:00:00","ES",100.5,101,99.5,100,1500\n')
+
+        executed = [re.sub(r"\s+", " ", render(call[0][0])).strip() for call in mock_cursor.execute.call_args_list]
+        self.assertIn(
+            'INSERT INTO "futures_data"."ohlcv_1d" ("time", "symbol", "open", "high", "low", "close", "volume") '
+            'SELECT "time", "symbol", "open", "high", "low", "close", "volume" FROM "_staging_ohlcv_1d" '
+            "ON CONFLICT DO NOTHING;",
+            executed,
+        )
+        self.assertEqual(executed[-1], 'DROP TABLE IF EXISTS "_staging_ohlcv_1d"')
+
+    def test_insert_arrow_empty(self) -> None:
+        """
+        Test inserting an empty Arrow table, expecting ValueError.
+        """
+        self.inserter.connection = MagicMock()
+        with self.assertRaises(ValueError):
+            self.inserter.insert_arrow(pa.table({"time": []}), schema="futures_data", table="ohlcv_1d")
+
+    @patch("src.modules.inserter.timescaledb_inserter.ThreadedConnectionPool")
+    def test_close_connection(self, mock_pool_class: MagicMock) -> None:
         """
-        Test closing an active database connection.
+        Test that closing returns the connection to the pool instead of closing it.
         """
-        mock_connection = mock_connect.return_value
+        mock_pool = self._configure_pool(mock_pool_class)
+        mock_connection = mock_pool.getconn.return_value
+        mock_connection.closed = 0
         self.inserter.connect()
         self.inserter.close()
-        mock_connection.close.assert_called_once()
-        self.assertIsNone(self.inserter.connection, "Database connection should be closed after close()")
+        mock_pool.putconn.assert_called_with(mock_connection, close=False)
+        mock_connection.close.assert_not_called()
+        self.assertIsNone(self.inserter.connection, "Database connection should be released after close()")
 
 
 if __name__ == "__main__":
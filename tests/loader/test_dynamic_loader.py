@@ -51,6 +51,17 @@ class TestDynamicLoader(unittest.TestCase):
         config: Dict[str, Any] = load_config(temp_file_path)
         self.assertEqual(config, self.mock_config, "Loaded configuration does not match expected result.")
 
+    def test_load_config_returns_independent_copies(self) -> None:
+        """
+        Test that repeated loads of a cached file do not share mutable state.
+        """
+        temp_file_path: str = self.create_temp_yaml(self.mock_config)
+        first: Dict[str, Any] = load_config(temp_file_path)
+        first["fetcher"]["class"] = "Mutated"
+
+        second: Dict[str, Any] = load_config(temp_file_path)
+        self.assertEqual(second, self.mock_config, "Mutating a loaded config leaked into the cache.")
+
     def test_load_config_missing_file(self) -> None:
         """
         Test that `load_config` raises FileNotFoundError for a non-existent file.
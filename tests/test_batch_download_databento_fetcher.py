@@ -5,6 +5,7 @@ import numpy as np
 import pandas as pd
 import databento as db
 from src.modules.batch_download_databento_fetcher import BatchDownloadDatabentoFetcher
+from src.modules.fetcher.databento_fetcher import get_client
 
 class TestBatchDownloadDatabentoFetcher(unittest.IsolatedAsyncioTestCase):
     def setUp(self) -> None:
@@ -28,6 +29,9 @@ class TestBatchDownloadDatabentoFetcher(unittest.IsolatedAsyncioTestCase):
         self.mock_schema = MagicMock()
         self.mock_stype = MagicMock()
         
+        # Drop any client shared from a previous test so the patched Historical is used
+        get_client.cache_clear()
+
         # Create patches
         self.patches = [
             patch("data.modules.databento_fetcher.db.Historical"),
@@ -0,0 +1,87 @@
+import os
+import tempfile
+import unittest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+import pandas as pd
+from src.modules.cache import FileCache
+
+
+class TestFileCache(unittest.TestCase):
+    """
+    Unit tests for the FileCache class.
+    """
+
+    def setUp(self) -> None:
+        """
+        Create a FileCache rooted in a temporary directory.
+        """
+        self.temp_dir: tempfile.TemporaryDirectory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.cache: FileCache = FileCache(cache_dir=self.temp_dir.name, ttl_days=1)
+        self.data: pd.DataFrame = pd.DataFrame({
+            "ts_event": pd.to_datetime(["2023-01-01", "2023-01-02"], utc=True),
+            "open": [100.5, 101.0],
+            "volume": [1500, 1600],
+            "symbol": ["MES.v.0", "MES.v.0"],
+        })
+
+    def test_make_key_ignores_parameter_order(self) -> None:
+        """
+        Test that the key depends on parameter values, not their order.
+        """
+        first: str = FileCache.make_key({"symbol": "ES", "start": "2023-01-01"})
+        second: str = FileCache.make_key({"start": "2023-01-01", "symbol": "ES"})
+        other: str = FileCache.make_key({"symbol": "NQ", "start": "2023-01-01"})
+
+        self.assertEqual(first, second)
+        self.assertNotEqual(first, other)
+
+    def test_put_then_get_round_trips(self) -> None:
+        """
+        Test that a written entry is read back unchanged from its namespace directory.
+        """
+        self.cache.put("abc", self.data, namespace="MES.v.0")
+
+        self.assertTrue(os.path.exists(os.path.join(self.temp_dir.name, "MES.v.0", "abc.parquet")))
+        pd.testing.assert_frame_equal(self.cache.get("abc", namespace="MES.v.0"), self.data)
+
+    def test_get_missing_entry(self) -> None:
+        """
+        Test that an unknown key is a miss.
+        """
+        self.assertIsNone(self.cache.get("missing", namespace="MES.v.0"))
+
+    def test_get_expired_entry(self) -> None:
+        """
+        Test that entries older than the TTL are treated as misses.
+        """
+        self.cache.put("abc", self.data, namespace="MES.v.0")
+
+        later: datetime = datetime.now(timezone.utc) + timedelta(days=2)
+        with patch("src.modules.cache.datetime") as mock_datetime:
+            mock_datetime.now.return_value = later
+            mock_datetime.fromisoformat = datetime.fromisoformat
+            self.assertIsNone(self.cache.get("abc", namespace="MES.v.0"))
+
+    def test_empty_entry_uses_its_own_ttl(self) -> None:
+        """
+        Test that an empty (negative) entry is a hit until its per-entry TTL passes.
+        """
+        empty: pd.DataFrame = pd.DataFrame(columns=["time", "open", "symbol"])
+        self.cache.put("empty", empty, namespace="MES.v.0", ttl=timedelta(hours=1))
+
+        cached = self.cache.get("empty", namespace="MES.v.0")
+        self.assertIsNotNone(cached)
+        self.assertTrue(cached.empty)
+        self.assertListEqual(list(cached.columns), ["time", "open", "symbol"])
+
+        later: datetime = datetime.now(timezone.utc) + timedelta(hours=2)
+        with patch("src.modules.cache.datetime") as mock_datetime:
+            mock_datetime.now.return_value = later
+            mock_datetime.fromisoformat = datetime.fromisoformat
+            self.assertIsNone(self.cache.get("empty", namespace="MES.v.0"))
+
+
+if __name__ == "__main__":
+    unittest.main()
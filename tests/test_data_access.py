@@ -60,33 +60,64 @@ class TestDataAccess(unittest.TestCase):
             # Mock chain, run test...
 
             mock_query_result = [
-                OHLCV(
-                    time=datetime.fromisoformat("2023-01-01T00:00:00+00:00"),
-                    symbol="NQ",
-                    open=200.0,
-                    high=201.0,
-                    low=199.0,
-                    close=200.5,
-                    volume=2000,
-                )
+                {
+                    "time": datetime.fromisoformat("2023-01-01T00:00:00+00:00"),
+                    "symbol": "NQ",
+                    "open": 200.0,
+                    "high": 201.0,
+                    "low": 199.0,
+                    "close": 200.5,
+                    "volume": 2000,
+                }
             ]
 
-            # Set return values on the mock query chain
-            mock_session.query.return_value.filter.return_value.order_by.return_value.all.return_value = mock_query_result
+            # Set return values on the mock chain
+            mock_session.execute.return_value.mappings.return_value.all.return_value = mock_query_result
 
             result: List[Dict[str, Any]] = data_access.get_ohlcv_data("2023-01-01", "2023-01-01")
-            print(f"Mock Query Call Chain: {mock_session.query.return_value.filter.return_value.order_by.return_value.all.call_args_list}")
-            print(f"Returned Data: {result}")
+
+            # One query, selecting the table's columns in symbol/time order without streaming
+            mock_session.execute.assert_called_once()
+            statement = mock_session.execute.call_args[0][0]
+            self.assertEqual(
+                [column.name for column in statement.selected_columns],
+                [column.name for column in OHLCV.__table__.columns],
+            )
+            self.assertTrue(str(statement).endswith("ORDER BY futures_data.ohlcv_1d.symbol, futures_data.ohlcv_1d.time"))
+            self.assertNotIn("stream_results", statement.get_execution_options())
 
             self.assertEqual(len(result), 1, "Expected one record to be returned")
             self.assertEqual(result[0]["symbol"], "NQ", "Expected symbol 'NQ' to be returned")
 
+    def test_iter_ohlcv_data(self) -> None:
+        """
+        Test that OHLCV records are streamed through a server-side cursor one batch at a time.
+        """
+        rows: List[Dict[str, Any]] = [
+            {"time": datetime.fromisoformat(f"2023-01-0{day}T00:00:00+00:00"), "symbol": "ES", "close": float(day)}
+            for day in (1, 2, 3)
+        ]
+        mappings = self.mock_session.execute.return_value.mappings.return_value
+        mappings.partitions.return_value = iter([rows[:2], rows[2:]])
+
+        batches = self.data_access.iter_ohlcv_data("2023-01-01", "2023-01-03", ["ES"], batch_size=2)
+        self.mock_session.execute.assert_not_called()
+
+        self.assertEqual(next(batches), rows[:2])
+        statement = self.mock_session.execute.call_args[0][0]
+        self.assertTrue(statement.get_execution_options()["stream_results"])
+        mappings.partitions.assert_called_once_with(2)
+        mappings.all.assert_not_called()
+
+        self.assertEqual(list(batches), [rows[2:]])
+        self.mock_session.__exit__.assert_called_once()
+
     def test_get_symbols(self) -> None:
         """
         Test retrieving unique symbols from the OHLCV table.
         """
-        mock_query_result: List[tuple[str]] = [("AAPL",), ("MSFT",)]
-        self.mock_session.query.return_value.distinct.return_value.all.return_value = mock_query_result
+        mock_query_result: List[str] = ["AAPL", "MSFT"]
+        self.mock_session.scalars.return_value.all.return_value = mock_query_result
 
         symbols: List[str] = self.data_access.get_symbols()
         self.assertIn("AAPL", symbols)
@@ -1,4 +1,7 @@
+import asyncio
+import threading
 import unittest
+import pandas as pd
 from unittest.mock import patch, MagicMock, AsyncMock
 from typing import Dict, Any
 from src.orchestrator import Orchestrator
@@ -124,6 +127,41 @@ class TestOrchestrator(unittest.IsolatedAsyncioTestCase):
             table="ohlcv_1d"
         )
 
+    @patch("src.orchestrator.DataAccess")
+    @patch("src.orchestrator.get_instance")
+    async def test_symbols_are_stored_concurrently(
+        self,
+        mock_get_instance: MagicMock,
+        mock_data_access: MagicMock,
+    ) -> None:
+        """
+        Test that symbols are cleaned and inserted on worker threads, each with its own inserter.
+        """
+        self.mock_config["batch_downloading"] = {"batch": False}
+        self.mock_config["database"]["pool_size"] = 2
+        # Both workers must be inside connect() at the same time to get past the barrier
+        barrier = threading.Barrier(2, timeout=5)
+        inserters = [MagicMock(spec=["connect", "insert_data", "close"]) for _ in range(2)]
+        for inserter in inserters:
+            inserter.connect.side_effect = barrier.wait
+
+        fetcher = MagicMock()
+        fetcher.fetch_data = AsyncMock(return_value=pd.DataFrame({"time": ["2023-01-01"]}))
+        cleaner = MagicMock(spec=["clean"])
+        cleaner.clean.return_value = [{"time": "2023-01-01"}]
+        mock_get_instance.side_effect = [MagicMock(), fetcher, cleaner, inserters[0], inserters[1]]
+
+        orchestrator = Orchestrator(config=self.mock_config)
+        await asyncio.gather(*[
+            orchestrator.retrieve_and_process_data({"dataSymbol": symbol, "instrumentType": "FUTURE"}, "2023-01-01", "2023-01-02")
+            for symbol in ("ES", "NQ")
+        ])
+
+        for inserter in inserters:
+            self.assertEqual(inserter.insert_data.call_count, 2)
+            inserter.close.assert_called_once()
+        self.assertCountEqual(orchestrator._idle_inserters, inserters)
+
 
 if __name__ == "__main__":
     unittest.main()
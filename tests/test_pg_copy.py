@@ -0,0 +1,77 @@
+import unittest
+from unittest.mock import MagicMock
+import io
+import re
+from typing import List
+
+import psycopg2
+
+from src.modules.pg_copy import copy_skip_duplicates
+from tests.helpers import render
+
+
+class TestCopySkipDuplicates(unittest.TestCase):
+    """
+    Unit tests for `copy_skip_duplicates` against a mocked psycopg2 cursor.
+    """
+
+    def setUp(self) -> None:
+        """
+        Set up a mocked cursor and a one-row CSV buffer.
+        """
+        self.cursor: MagicMock = MagicMock()
+        self.cursor.rowcount = 1
+        self.buffer: io.StringIO = io.StringIO("2023-01-01 00:00:00+00:00,ES,100.0\n")
+        self.columns: List[str] = ["time", "symbol", "close"]
+
+    def executed(self) -> List[str]:
+        """
+        Return the statements run on the cursor as whitespace-normalized text.
+        """
+        return [re.sub(r"\s+", " ", render(c[0][0])).strip() for c in self.cursor.execute.call_args_list]
+
+    def test_drops_staging_table_after_merge(self) -> None:
+        """
+        Test that the staging table is dropped once the rows are merged into the target.
+        """
+        rows: int = copy_skip_duplicates(self.cursor, self.buffer, "futures_data", "ohlcv_1d", self.columns)
+
+        self.assertEqual(rows, 1)
+        executed: List[str] = self.executed()
+        self.assertEqual(
+            executed[1],
+            'CREATE TEMP TABLE "_staging_ohlcv_1d" (LIKE "futures_data"."ohlcv_1d" INCLUDING DEFAULTS)',
+        )
+        self.assertTrue(executed[2].startswith('INSERT INTO "futures_data"."ohlcv_1d"'))
+        self.assertEqual(executed[-1], 'DROP TABLE IF EXISTS "_staging_ohlcv_1d"')
+
+    def test_on_commit_drop_leaves_dropping_to_transaction(self) -> None:
+        """
+        Test that on_commit_drop creates the staging table with ON COMMIT DROP and issues no
+        explicit DROP after the merge.
+        """
+        copy_skip_duplicates(
+            self.cursor, self.buffer, "futures_data", "ohlcv_1d", self.columns, on_commit_drop=True
+        )
+
+        executed: List[str] = self.executed()
+        self.assertTrue(executed[1].endswith("INCLUDING DEFAULTS) ON COMMIT DROP"))
+        self.assertEqual(len(executed), 3)
+        self.assertTrue(executed[-1].startswith("INSERT INTO"))
+
+    def test_copy_error_propagates(self) -> None:
+        """
+        Test that a failed COPY raises its own error and no further statement is run.
+        """
+        copy_error = psycopg2.errors.BadCopyFileFormat("extra data after last expected column")
+        self.cursor.copy_expert.side_effect = copy_error
+
+        with self.assertRaises(psycopg2.Error) as raised:
+            copy_skip_duplicates(self.cursor, self.buffer, "futures_data", "ohlcv_1d", self.columns)
+
+        self.assertIs(raised.exception, copy_error)
+        self.assertEqual(len(self.executed()), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,10 +1,27 @@
+import copy
 import importlib
 import os
 import yaml
+from functools import lru_cache
 from typing import Any, Dict, Tuple
 from datetime import datetime, timedelta
 from src.modules.data_access import DataAccess 
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
+
+@lru_cache(maxsize=16)
+def _parse_config(config_path: str, mtime_ns: int) -> Any:
+    """
+    Parse a YAML file; cached per (path, mtime) so an edited file is re-read.
+    """
+    with open(config_path, "r") as file:
+        return yaml.load(file, Loader=YamlLoader)
+
 
 def load_config(config_path: str = "src/config/config.yaml") -> Dict[str, Any]:
     """
@@ -22,11 +39,11 @@ def load_config(config_path: str = "src/config/config.yaml") -> Dict[str, Any]:
     """
     if not os.path.exists(config_path):
         raise FileNotFoundError(f"Configuration file not found at {config_path}")
-    with open(config_path, "r") as file:
-        try:
-            config: Dict[str, Any] = yaml.safe_load(file)
-        except yaml.YAMLError as e:
-            raise ValueError(f"Error parsing configuration file at {config_path}: {e}")
+    try:
+        # Hand each caller its own copy so mutating it cannot leak into the cache
+        config: Dict[str, Any] = copy.deepcopy(_parse_config(config_path, os.stat(config_path).st_mtime_ns))
+    except yaml.YAMLError as e:
+        raise ValueError(f"Error parsing configuration file at {config_path}: {e}")
 
     if not config:
         raise ValueError(f"Configuration file at {config_path} is empty or invalid.")